@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
+import os
 import re
 import socket
+import time
+import queue
+import threading
 import datetime
 from enum import Enum
-from typing import List
+from typing import Any, Callable, List, Optional, Set
 
 
 #Перечислитель LogLevel
@@ -13,12 +17,22 @@ class LogLevel(Enum):
     ERROR = 3
 
 
+# Поведение очереди QueueLogger при переполнении
+class OverflowPolicy(Enum):
+    BLOCK = 1 # Ждать освобождения места
+    DROP_NEWEST = 2 # Отбросить новую запись
+    DROP_OLDEST = 3 # Вытеснить самую старую запись
+
+
 # Интерфейс фильтра
 class ILogFilter(ABC):
     @abstractmethod
     def match(self, log_level: LogLevel, text: str) -> bool:
         pass
 
+    def levels(self) -> Optional[Set[LogLevel]]: # Уровни, которые фильтр может пропустить (None - любые)
+        return None
+
 
 # Фильтры
 class SimpleLogFilter(ILogFilter): # Пропуск, если содержит ключевое слово
@@ -50,6 +64,9 @@ class LevelFilter(ILogFilter): # Пропуск, если его уровень
     def match(self, log_level: LogLevel, text: str) -> bool:
         return log_level == self.level
 
+    def levels(self) -> Optional[Set[LogLevel]]:
+        return {self.level}
+
 
 # Интерфейс обработчика (Handler)
 class ILogHandler(ABC):
@@ -57,6 +74,12 @@ class ILogHandler(ABC):
     def handle(self, log_level: LogLevel, text: str) -> None:
         pass
 
+    def flush(self) -> None: # Сброс буферов (по умолчанию ничего не делает)
+        pass
+
+    def close(self) -> None: # Освобождение ресурсов
+        pass
+
 
 # Обработчики
 class ConsoleHandler(ILogHandler): # Вывод в стандартный поток вывода (консоль)
@@ -65,18 +88,113 @@ class ConsoleHandler(ILogHandler): # Вывод в стандартный пот
         print(f"[CONSOLE] {text}")
 
 
-class FileHandler(ILogHandler): # Вывод в текстовый файл
+class FileHandler(ILogHandler): # Вывод в текстовый файл через один постоянно открытый буферизованный дескриптор
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, flush_every: int = 1, flush_interval_ms: int = 0, flush_on_error: bool = True,
+                 fsync: bool = False, max_bytes: int = 0, rotate_interval: float = 0, backup_count: int = 5):
         self.filename = filename
+        self.flush_every = flush_every # Сбрасывать буфер каждые N записей
+        self.flush_interval_ms = flush_interval_ms # ... и/или каждые T миллисекунд
+        self.flush_on_error = flush_on_error # ... и/или сразу на записи ERROR
+        self.fsync = fsync # Вызывать os.fsync при каждом сбросе
+        self.max_bytes = max_bytes # Ротация по размеру (0 - выключена)
+        self.rotate_interval = rotate_interval # Ротация по времени в секундах (0 - выключена)
+        self.backup_count = backup_count # Сколько старых файлов хранить: filename.1 ... filename.N
+
+        self._lock = threading.RLock()
+        self._file = None
+        self._size = 0
+        self._pending = 0
+        self._rollover_at = 0.0
+        self._closed = False
+        self._stop = threading.Event()
+        if flush_interval_ms > 0:
+            threading.Thread(target=self._flush_periodically, daemon=True).start()
 
     def handle(self, log_level: LogLevel, text: str) -> None:
-        try:
-            # 'a' - append mode (добавление в конец файла)
-            with open(self.filename, "a", encoding="utf-8") as f:
-                f.write(f"{text}\n")
-        except Exception as e:
-            print(f"File Handler Error: {e}")
+        data = f"{text}{os.linesep}".encode("utf-8")
+
+        with self._lock:
+            if self._closed:
+                return
+
+            try:
+                if self._file is None:
+                    self._open()
+
+                if self._should_rotate(len(data)):
+                    self._rotate()
+
+                self._file.write(data)
+                self._size += len(data)
+                self._pending += 1
+
+                if self._pending >= self.flush_every or (self.flush_on_error and log_level == LogLevel.ERROR):
+                    self._flush()
+            except Exception as e:
+                print(f"File Handler Error: {e}")
+
+    def _open(self) -> None:
+        # 'ab' - append mode (добавление в конец файла), файл открывается один раз
+        self._file = open(self.filename, "ab")
+        self._size = self._file.tell()
+        if self.rotate_interval > 0:
+            self._rollover_at = time.time() + self.rotate_interval
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self.backup_count <= 0:
+            return False
+        if self.max_bytes > 0 and self._size > 0 and self._size + incoming > self.max_bytes:
+            return True
+        return self.rotate_interval > 0 and time.time() >= self._rollover_at
+
+    def _rotate(self) -> None:
+        self._flush()
+        self._file.close()
+        self._file = None
+
+        # Сдвигаем старые файлы: filename.1 -> filename.2 и т.д. (os.replace атомарен)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.filename}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.filename}.{index + 1}")
+        os.replace(self.filename, f"{self.filename}.1")
+
+        self._open()
+
+    def _flush(self) -> None:
+        if self._file is None or self._pending == 0:
+            return
+
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval_ms / 1000):
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            try:
+                self._flush()
+            except Exception as e:
+                print(f"File Handler Error: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._stop.set()
+            try:
+                self._flush()
+                if self._file is not None:
+                    self._file.close()
+            except Exception as e:
+                print(f"File Handler Error: {e}")
+            self._file = None
 
 
 class SocketHandler(ILogHandler): # Отправка в сокет
@@ -141,14 +259,38 @@ class StandardFormatter(ILogFormatter):
     """
     Форматирует сообщение к виду:
     [<log_level>] [<data:yyyy.MM.dd hh:mm:ss>] <text>
+
+    Шаблон разбирается один раз: всё, что стоит до и после {text}, зависит только
+    от уровня и времени, поэтому кэшируется на текущую секунду.
     """
 
-    def format(self, log_level: LogLevel, text: str, date_format: str = "%Y.%m.%d %H:%M:%S") -> str:
-        try:
-            level_name = log_level.name
-            now = datetime.datetime.now().strftime(date_format)
+    def __init__(self, template: str = "[{level}] [{time}] {text}", date_format: str = "%Y.%m.%d %H:%M:%S"):
+        self.template = template
+        self.date_format = date_format
+        self._split = template.split("{text}") if template.count("{text}") == 1 else None # Префикс и суффикс шаблона
+        self._state = (None, {}) # (секунда, {(уровень, формат даты): (префикс, суффикс)})
 
-            return f"[{level_name}] [{now}] {text}"
+    def format(self, log_level: LogLevel, text: str, date_format: str = None) -> str:
+        try:
+            date_format = date_format or self.date_format
+            if self._split is None or "%f" in date_format: # Без кэша: шаблон нельзя разрезать или нужны микросекунды
+                now = datetime.datetime.now().strftime(date_format)
+                return self.template.format(level=log_level.name, time=now, text=text)
+
+            second = int(time.time())
+            state = self._state
+            if state[0] != second:
+                state = (second, {})
+                self._state = state
+
+            key = (log_level, date_format)
+            parts = state[1].get(key)
+            if parts is None:
+                now = datetime.datetime.fromtimestamp(second).strftime(date_format)
+                parts = state[1][key] = (self._split[0].format(level=log_level.name, time=now),
+                                         self._split[1].format(level=log_level.name, time=now))
+
+            return parts[0] + text + parts[1]
         except Exception as e:
             print(f"Formatting Error: {e}")
 
@@ -161,7 +303,44 @@ class Logger:
         self.formatters = formatters if formatters else []
         self.handlers = handlers if handlers else []
 
-    def log(self, log_level: LogLevel, text: str) -> None:
+    @property
+    def filters(self) -> List[ILogFilter]:
+        return self._filters
+
+    @filters.setter
+    def filters(self, filters: List[ILogFilter]) -> None:
+        self._filters = filters
+        self._refresh_levels()
+
+    def add_filter(self, log_filter: ILogFilter) -> None:
+        self._filters.append(log_filter)
+        self._refresh_levels()
+
+    def remove_filter(self, log_filter: ILogFilter) -> None:
+        self._filters.remove(log_filter)
+        self._refresh_levels()
+
+    def _refresh_levels(self) -> None: # Пересчет уровней, которые пропустят фильтры по уровню
+        enabled = set(LogLevel)
+        for log_filter in self._filters:
+            levels = log_filter.levels()
+            if levels is not None:
+                enabled &= levels
+        self._enabled = frozenset(enabled)
+
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        return log_level in self._enabled
+
+    def log(self, log_level: LogLevel, text: str | Callable[[], str], *args: Any) -> None:
+        if log_level not in self._enabled: # Быстрый выход до построения сообщения
+            return
+
+        # Отложенное сообщение: шаблон с аргументами или функция, вычисляются только здесь
+        if args:
+            text = text.format(*args)
+        elif callable(text):
+            text = text()
+
         for log_filter in self.filters:
             if not log_filter.match(log_level, text): # Если хотя бы один фильтр вернет False, лог не проходит
                 return
@@ -173,14 +352,105 @@ class Logger:
         for handler in self.handlers: # Отправка обработчикам
             handler.handle(log_level, formatted_text)
 
-    def log_info(self, text: str) -> None:
-        self.log(LogLevel.INFO, text)
+    def log_info(self, text: str | Callable[[], str], *args: Any) -> None:
+        self.log(LogLevel.INFO, text, *args)
+
+    def log_warn(self, text: str | Callable[[], str], *args: Any) -> None:
+        self.log(LogLevel.WARN, text, *args)
+
+    def log_error(self, text: str | Callable[[], str], *args: Any) -> None:
+        self.log(LogLevel.ERROR, text, *args)
+
+    def flush(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        for handler in self.handlers:
+            handler.close()
+
+
+# Асинхронный Logger: log() только кладет запись в ограниченную очередь,
+# фильтры, форматтеры и обработчики выполняются фоновыми потоками
+class QueueLogger(Logger):
+    def __init__(self, filters: List[ILogFilter] = None, formatters: List[ILogFormatter] = None, handlers: List[ILogHandler] = None,
+                 max_size: int = 1024, workers: int = 1, overflow: OverflowPolicy = OverflowPolicy.BLOCK):
+        super().__init__(filters, formatters, handlers)
+        self.overflow = overflow
+        self.dropped = 0 # Счетчик отброшенных записей
+        self.failed = 0 # Счетчик записей, на которых упал обработчик
+        self._queue = queue.Queue(max_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def log(self, log_level: LogLevel, text: str | Callable[[], str], *args: Any) -> None:
+        if self._closed or log_level not in self._enabled:
+            return
+
+        record = (log_level, text, args)
+        if self.overflow is OverflowPolicy.BLOCK:
+            self._queue.put(record)
+            return
 
-    def log_warn(self, text: str) -> None:
-        self.log(LogLevel.WARN, text)
+        try:
+            self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        with self._lock:
+            if self.overflow is OverflowPolicy.DROP_NEWEST or self._closed:
+                self.dropped += 1
+                return
+
+            while True: # DROP_OLDEST: вытесняем старые записи, пока новая не поместится
+                try:
+                    self._queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    pass
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _work(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None: # Сигнал остановки от close()
+                    return
+                Logger.log(self, record[0], record[1], *record[2])
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                print(f"Logger Worker Error: {e}")
+            finally:
+                self._queue.task_done()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None: # Дожидаемся обработки всех записей в очереди
+        self._queue.join()
+        super().flush()
+
+    def close(self) -> None: # Корректное завершение: сначала очередь дорабатывается, затем потоки останавливаются
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
 
-    def log_error(self, text: str) -> None:
-        self.log(LogLevel.ERROR, text)
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        super().close()
 
 
 
@@ -1,24 +1,213 @@
+import asyncio
+import functools
+import inspect
+import sys
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Executor, Future
 from EventHandler import EventHandler
-from typing import TypeVar, Self
+from typing import Any, Callable, TypeVar, Self
 
 
 TEventArgs = TypeVar("TEventArgs")
 T = TypeVar("T")
 
+HandlerRef = Callable[[], EventHandler | None]
+
+
+class _StrongRef:
+    __slots__ = ("handler",)
+
+    def __init__(self, handler: EventHandler) -> None:
+        self.handler = handler
+
+    def __call__(self) -> EventHandler:
+        return self.handler
+
 
 class Event:
-    def __init__(self, handlers: list[EventHandler]) -> None:
-        self._handlers: list[EventHandler] = handlers
+    def __init__(self, handlers: list[EventHandler], ordered: bool = True, executor: Executor | None = None,
+                 on_error: Callable[[EventHandler, BaseException], None] | None = None) -> None:
+        self._handlers: list[HandlerRef] = [_StrongRef(handler) for handler in handlers]
+        self.ordered = ordered
+        self.executor = executor
+        self.on_error = on_error
+        self._dispatch: dict[type, tuple[HandlerRef, ...]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._serial: deque = deque()
+        self._draining = False
+        self._serial_lock = threading.Lock()
 
     def __iadd__(self, handler: EventHandler) -> Self:
-        self._handlers.append(handler)
+        self.subscribe(handler)
         return self
     
     def __isub__(self, handler: EventHandler) -> Self:
-        self._handlers.remove(handler)
+        self.unsubscribe(handler)
         return self
+
+    def __len__(self) -> int:
+        return self.live_count()
+
+    def subscribe(self, handler: EventHandler, weak: bool = False) -> None:
+        if weak:
+            self._handlers.append(weakref.ref(handler, self._prune))
+        else:
+            self._handlers.append(_StrongRef(handler))
+        self._dispatch.clear()
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        for i, ref in enumerate(self._handlers):
+            if ref() is handler:
+                del self._handlers[i]
+                self._dispatch.clear()
+                return
+        raise ValueError(f'{handler!r} is not subscribed')
+
+    def _prune(self, dead: weakref.ref) -> None:
+        try:
+            self._handlers.remove(dead)
+        except ValueError:
+            pass
+        self._dispatch.clear()
+
+    def live_count(self) -> int:
+        return sum(1 for ref in self._handlers if ref() is not None)
+
+    def _handlers_for(self, args_type: type) -> tuple[HandlerRef, ...]:
+        handlers = self._dispatch.get(args_type)
+        if handlers is None:
+            matched = []
+            for ref in self._handlers:
+                handler = ref()
+                if handler is not None and (handler.args_type is None or issubclass(args_type, handler.args_type)):
+                    matched.append(ref)
+            handlers = tuple(matched)
+            self._dispatch[args_type] = handlers
+        return handlers
+
+    def has_handlers(self, args_type: type) -> bool:
+        return bool(self._handlers_for(args_type))
     
     def invoke(self, sender: T, args: TEventArgs) -> None:
-        for handler in self._handlers:
-            handler.handle(sender, args)
-    
+        pending = []
+        for ref in self._handlers_for(type(args)):
+            handler = ref()
+            if handler is not None:
+                result = handler.handle(sender, args)
+                if inspect.isawaitable(result):
+                    pending.append(result)
+
+        if pending:
+            self._schedule(pending)
+
+    def notify(self, sender: T, args: TEventArgs) -> list[Future] | None:
+        if self.executor is None:
+            self.invoke(sender, args)
+            return None
+
+        submitted = self._submit(sender, args, self.executor)
+        for handler, future in submitted:
+            future.add_done_callback(functools.partial(self._report, handler))
+        return [future for _, future in submitted]
+
+    def _report(self, handler: EventHandler, future: Future) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        if self.on_error is not None:
+            self.on_error(handler, future.exception())
+        else:
+            print(f'Event handler {type(handler).__name__} failed: {future.exception()!r}', file=sys.stderr)
+
+    def _schedule(self, pending: list) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._complete(pending))
+            return
+
+        task = loop.create_task(self._complete(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _complete(self, pending: list) -> None:
+        errors = []
+        if self.ordered:
+            for awaitable in pending:
+                try:
+                    await awaitable
+                except Exception as e:
+                    errors.append(e)
+        else:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            errors = [result for result in results if isinstance(result, Exception)]
+
+        if errors:
+            raise ExceptionGroup("event handlers failed", errors)
+
+    def _live_handlers(self, args_type: type) -> list[EventHandler]:
+        return [handler for handler in (ref() for ref in self._handlers_for(args_type)) if handler is not None]
+
+    async def invoke_async(self, sender: T, args: TEventArgs) -> list[BaseException]:
+        errors: list[BaseException] = []
+        pending = []
+        for handler in self._live_handlers(type(args)):
+            try:
+                result = handler.handle(sender, args)
+                if inspect.isawaitable(result):
+                    if self.ordered:
+                        await result
+                    else:
+                        pending.append(result)
+            except Exception as e:
+                errors.append(e)
+
+        if pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            errors.extend(result for result in results if isinstance(result, Exception))
+        return errors
+
+    def invoke_in_pool(self, sender: T, args: TEventArgs, executor: Executor) -> list[Future]:
+        return [future for _, future in self._submit(sender, args, executor)]
+
+    def _submit(self, sender: Any, args: Any, executor: Executor) -> list[tuple[EventHandler, Future]]:
+        handlers = self._live_handlers(type(args))
+        if not self.ordered:
+            return [(handler, executor.submit(self._run_blocking, handler, sender, args)) for handler in handlers]
+
+        futures = [Future() for _ in handlers]
+        with self._serial_lock:
+            self._serial.append((handlers, futures, sender, args))
+            if self._draining:
+                return list(zip(handlers, futures))
+            self._draining = True
+        executor.submit(self._drain_serial)
+        return list(zip(handlers, futures))
+
+    def _drain_serial(self) -> None:
+        while True:
+            with self._serial_lock:
+                if not self._serial:
+                    self._draining = False
+                    return
+                handlers, futures, sender, args = self._serial.popleft()
+            self._run_ordered(handlers, futures, sender, args)
+
+    @staticmethod
+    def _run_blocking(handler: EventHandler, sender: Any, args: Any) -> None:
+        result = handler.handle(sender, args)
+        if inspect.isawaitable(result):
+            asyncio.run(result)
+
+    @classmethod
+    def _run_ordered(cls, handlers: list[EventHandler], futures: list[Future], sender: Any, args: Any) -> None:
+        for handler, future in zip(handlers, futures):
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                cls._run_blocking(handler, sender, args)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(None)
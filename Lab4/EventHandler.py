@@ -1,10 +1,24 @@
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, get_args, get_origin
 from abc import ABC, abstractmethod
 
 TEventArgs = TypeVar("TEventArgs")
 
 
 class EventHandler(Generic[TEventArgs], ABC):
+    args_type: type | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "args_type" in cls.__dict__:
+            return
+
+        for base in getattr(cls, "__orig_bases__", ()):
+            if get_origin(base) is EventHandler:
+                declared = get_args(base)[0]
+                if isinstance(declared, type):
+                    cls.args_type = declared
+                return
+
     @abstractmethod
     def handle(self, sender: object, args: TEventArgs) -> None:
         pass
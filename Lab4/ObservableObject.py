@@ -0,0 +1,93 @@
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from Event import Event
+from PropertiesChangedEventArgs import PropertiesChangedEventArgs
+from PropertyChangedEventArgs import PropertyChangedEventArgs
+from PropertyChangedEventHandler import PropertyChangedEventHandler
+from PropertyChangingEventHandler import PropertyChangingEventHandler
+from PropertyChangingMaxLenHandler import PropertyChangingMaxLenHandler
+from typing import Any, Callable, Iterator, Union
+
+Validator = tuple[type, Callable[[Any, Any], Any]]
+
+
+class ObservableObject:
+    _observer: Event | None = None
+    _batch: dict[str, tuple] | None = None
+    _event_ordered: bool = True
+    _event_executor: Executor | None = None
+    _event_on_error: Callable[[Any, BaseException], None] | None = None
+
+    def add_handler(self, handler: Union[PropertyChangedEventHandler,
+                                         PropertyChangingEventHandler, PropertyChangingMaxLenHandler], weak: bool = False) -> None:
+        if self._observer is None:
+            self._observer = Event([], self._event_ordered, self._event_executor, self._event_on_error)
+        self._observer.subscribe(handler, weak)
+
+    def configure_events(self, executor: Executor | None = None, ordered: bool = True,
+                         on_error: Callable[[Any, BaseException], None] | None = None) -> None:
+        self._event_executor = executor
+        self._event_ordered = ordered
+        self._event_on_error = on_error
+        if self._observer is not None:
+            self._observer.executor = executor
+            self._observer.ordered = ordered
+            self._observer.on_error = on_error
+
+    def _validate(self, validators: tuple[Validator, ...], old_value: Any, new_value: Any) -> bool:
+        observer = self._observer
+        for args_type, build_args in validators:
+            if not observer.has_handlers(args_type):
+                continue
+
+            args = build_args(old_value, new_value)
+            observer.invoke(self, args)
+            if args.cancel:
+                return False
+        return True
+
+    def _set_property(self, prop_name: str, validators: tuple[Validator, ...], old_value: Any, new_value: Any) -> None:
+        if self._batch is not None:
+            if prop_name not in self._batch:
+                self._batch[prop_name] = (old_value, validators)
+            self.__dict__[prop_name] = new_value
+            return
+
+        if not self._validate(validators, old_value, new_value):
+            return
+
+        self.__dict__[prop_name] = new_value
+        if self._observer.has_handlers(PropertyChangedEventArgs):
+            self._observer.notify(self, PropertyChangedEventArgs(prop_name))
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = {}
+        try:
+            yield
+        finally:
+            changes, self._batch = self._batch, None
+            self._commit_batch(changes)
+
+    def _commit_batch(self, changes: dict[str, tuple]) -> None:
+        observer = self._observer
+        if observer is None:
+            return
+
+        committed = []
+        for prop_name, (old_value, validators) in changes.items():
+            new_value = self.__dict__[prop_name]
+            if new_value == old_value:
+                continue
+
+            if self._validate(validators, old_value, new_value):
+                committed.append(prop_name)
+            else:
+                self.__dict__[prop_name] = old_value
+
+        if committed and observer.has_handlers(PropertiesChangedEventArgs):
+            observer.notify(self, PropertiesChangedEventArgs(committed))
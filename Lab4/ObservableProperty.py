@@ -0,0 +1,43 @@
+from PropertyChangingEventArgs import PropertyChangingEventArgs
+from PropertyChangingMaxLenArgs import PropertyChangingMaxLenArgs
+from typing import Any, Callable
+
+_MISSING = object()
+
+
+class ObservableProperty:
+    def __init__(self, attr_name: str, can_change: bool = True, min_len: int | None = None,
+                 max_len: int | None = None) -> None:
+        self.attr_name = attr_name
+        self.can_change = can_change
+        self.min_len = min_len
+        self.max_len = max_len
+        self.validators = self._compile_validators()
+
+    def _compile_validators(self) -> tuple[tuple[type, Callable[[Any, Any], Any]], ...]:
+        attr_name, can_change, min_len, max_len = self.attr_name, self.can_change, self.min_len, self.max_len
+
+        validators = [(PropertyChangingEventArgs,
+                       lambda old_value, new_value: PropertyChangingEventArgs(attr_name, old_value, new_value,
+                                                                              can_change))]
+        if min_len is not None and max_len is not None:
+            validators.append((PropertyChangingMaxLenArgs,
+                               lambda old_value, new_value: PropertyChangingMaxLenArgs(attr_name, old_value, new_value,
+                                                                                       min_len, max_len)))
+        return tuple(validators)
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.attr_name]
+        except KeyError:
+            raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{self.attr_name}'") from None
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        values = obj.__dict__
+        old_value = values.get(self.attr_name, _MISSING)
+        if old_value is _MISSING or (obj._observer is None and obj._batch is None):
+            values[self.attr_name] = value
+            return
+        obj._set_property(self.attr_name, self.validators, old_value, value)
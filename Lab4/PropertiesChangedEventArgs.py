@@ -0,0 +1,9 @@
+from PropertyChangedEventArgs import PropertyChangedEventArgs
+
+
+class PropertiesChangedEventArgs(PropertyChangedEventArgs):
+    __slots__ = ("prop_names",)
+
+    def __init__(self, prop_names: list[str]) -> None:
+        super().__init__(", ".join(prop_names))
+        self.prop_names = prop_names
@@ -1,3 +1,5 @@
 class PropertyChangedEventArgs:
+    __slots__ = ("prop_name",)
+
     def __init__(self, prop_name: str) -> None:
         self.prop_name = prop_name
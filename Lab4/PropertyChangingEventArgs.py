@@ -2,8 +2,11 @@ from typing import Any
 
 
 class PropertyChangingEventArgs:
+    __slots__ = ("prop_name", "cancel", "old_value", "new_value", "can_change")
+
     def __init__(self, prop_name: str, old_value: Any, new_value: Any, can_change: bool) -> None:
         self.prop_name = prop_name
         self.old_value = old_value
         self.new_value = new_value
         self.can_change = can_change
+        self.cancel = False
@@ -9,7 +9,7 @@ class PropertyChangingEventHandler(Generic[TEventArgs], EventHandler[PropertyCha
     def handle(self, sender: object, args: PropertyChangingEventArgs) -> None:
         if isinstance(args, PropertyChangingEventArgs):
             if not args.can_change:
-                sender.__dict__[args.prop_name] = args.old_value
+                args.cancel = True
                 print(f'Changing property {args.prop_name} in object {sender} from {args.old_value} to {args.new_value} was cancelled')
                 return
 
@@ -12,7 +12,7 @@ class PropertyChangingMaxLenHandler(Generic[TEventArgs], EventHandler[PropertyCh
 
         if not (args.min_len <= (args.new_value if isinstance(args.new_value, (int, float)) else len(args.new_value))
                 <= args.max_len):
-            sender.__dict__[args.prop_name] = args.old_value
+            args.cancel = True
             print(f'Changing property {args.prop_name} in object {sender} from {args.old_value} to {args.new_value} was cancelled')
             return
 
@@ -1,63 +1,16 @@
-from Event import Event
-from PropertyChangedEventArgs import PropertyChangedEventArgs
-from PropertyChangedEventHandler import PropertyChangedEventHandler
-from PropertyChangingEventArgs import PropertyChangingEventArgs
-from PropertyChangingEventHandler import PropertyChangingEventHandler
-from PropertyChangingMaxLenArgs import PropertyChangingMaxLenArgs
-from PropertyChangingMaxLenHandler import PropertyChangingMaxLenHandler
-from typing import Union
+from ObservableObject import ObservableObject
+from ObservableProperty import ObservableProperty
 
 
-class Student:
+class Student(ObservableObject):
+    name = ObservableProperty("_name", can_change=False, min_len=4, max_len=7)
+    profile = ObservableProperty("_study_profile", can_change=True, min_len=2, max_len=4)
+    age = ObservableProperty("_age", can_change=True, min_len=16, max_len=20)
+
     def __init__(self, name: str, study_profile: str, age: int) -> None:
         self._name = name
         self._study_profile = study_profile
         self._age = age
-        self._observer = Event([])
     
     def __str__(self) -> str:
         return self.__class__.__name__
-    
-    @property
-    def name(self) -> str:
-        return self._name
-    
-    @name.setter
-    def name(self, new_name: str) -> None:
-        old_value = self._name
-        self._name = new_name
-
-        self._observer.invoke(self, PropertyChangingEventArgs("_name", old_value, new_name, False))
-        self._observer.invoke(self, PropertyChangedEventArgs("_name"))
-        self._observer.invoke(self, PropertyChangingMaxLenArgs("_name", old_value, new_name, 4,7))
-    
-    @property
-    def profile(self) -> str:
-        return self._study_profile
-    
-    @profile.setter
-    def profile(self, new_profile: str) -> None:
-        old_value = self._study_profile
-        self._study_profile = new_profile
-
-        self._observer.invoke(self, PropertyChangingEventArgs("_study_profile",
-                                                              old_value, new_profile, True))
-        self._observer.invoke(self, PropertyChangedEventArgs("_study_profile"))
-        self._observer.invoke(self, PropertyChangingMaxLenArgs("_study_profile", old_value, new_profile, 2, 4))
-    
-    @property
-    def age(self) -> int:
-        return self._age
-    
-    @age.setter
-    def age(self, new_value: int) -> None:
-        old_value = self._age
-        self._age = new_value
-
-        self._observer.invoke(self, PropertyChangingEventArgs("_age", old_value, new_value, True))
-        self._observer.invoke(self, PropertyChangedEventArgs("_age"))
-        self._observer.invoke(self, PropertyChangingMaxLenArgs("_study_profile", old_value, new_value, 16, 20))
-
-    def add_handler(self, handler: Union[PropertyChangedEventHandler,
-                                         PropertyChangingEventHandler, PropertyChangingMaxLenHandler]) -> None:
-        self._observer += handler
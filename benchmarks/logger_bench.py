@@ -0,0 +1,282 @@
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'lab_3'))
+sys.path.insert(0, os.path.join(ROOT, 'Lab3'))
+
+import Lab3
+from Logger import Logger
+from LogLevel import LogLevel
+from Filters.LevelLogFilter import LevelLogFilter
+from Filters.ReLogFilter import ReLogFilter
+from Formatters.SimpleFormatter import SimpleFormatter
+from Handlers.ILogHandler import ILogHandler
+from Handlers.FileHandler import FileHandler
+from Handlers.SocketHandler import SocketHandler
+from Handlers.FtpHandler import FtpHandler
+
+THREADS = (1, 4, 16)
+METRICS = ('records_per_sec', 'p50_us', 'p99_us')
+
+
+class NullHandler(ILogHandler):
+    def handle(self, log_level: LogLevel, text: str) -> None:
+        pass
+
+
+class Lab3NullHandler(Lab3.ILogHandler):
+    def handle(self, log_level: Lab3.LogLevel, text: str) -> None:
+        pass
+
+
+class LocalReceiver:
+    def __init__(self) -> None:
+        self.received = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen()
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._drain, args=(connection,), daemon=True).start()
+
+    def _drain(self, connection: socket.socket) -> None:
+        with connection:
+            while True:
+                data = connection.recv(65536)
+                if not data:
+                    return
+                self.received += len(data)
+
+    def close(self) -> None:
+        self._server.close()
+
+
+class LocalFtp:
+    uploaded = 0
+
+    def __init__(self, server: str, timeout: float | None = None) -> None:
+        self.server = server
+
+    def login(self, username: str, password: str) -> None:
+        pass
+
+    def storbinary(self, command: str, file) -> None:
+        LocalFtp.uploaded += len(file.read())
+
+    def quit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def lab3_scenarios(directory: str) -> dict:
+    level = Lab3.LogLevel
+    formatter = Lab3.StandardFormatter()
+    return {
+        'level_filtered': lambda: (Lab3.Logger([Lab3.LevelFilter(level.ERROR)], [formatter], [Lab3NullHandler()]), None),
+        'regex_filtered': lambda: (Lab3.Logger([Lab3.ReLogFilter(r"\d{3,}")], [formatter], [Lab3NullHandler()]), None),
+        'file': lambda: (Lab3.Logger([], [formatter], [Lab3.FileHandler(os.path.join(directory, 'lab3.log'))]), None),
+    }
+
+
+def lab_3_scenarios(directory: str) -> dict:
+    def file_logger():
+        path = os.path.join(directory, 'lab_3.log')
+        open(path, 'a').close()
+        return Logger([], [SimpleFormatter()], [FileHandler(path)]), None
+
+    def socket_logger():
+        receiver = LocalReceiver()
+        return Logger([], [SimpleFormatter()], [SocketHandler('127.0.0.1', receiver.port)]), receiver.close
+
+    def ftp_logger():
+        handler = FtpHandler('localhost', 'user', 'password', 'bench.txt', ftp_factory=LocalFtp)
+        return Logger([], [SimpleFormatter()], [handler]), None
+
+    return {
+        'level_filtered': lambda: (Logger([LevelLogFilter(LogLevel.ERROR)], [SimpleFormatter()], [NullHandler()]), None),
+        'regex_filtered': lambda: (Logger([ReLogFilter(r".*\d{3,}.*")], [SimpleFormatter()], [NullHandler()]), None),
+        'file': file_logger,
+        'socket': socket_logger,
+        'ftp': ftp_logger,
+    }
+
+
+def run_scenario(build, log_levels: tuple, records: int, threads: int) -> dict:
+    logger, cleanup = build()
+    per_thread = max(records // threads, 1)
+    latencies = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def produce(index: int) -> None:
+        samples = latencies[index]
+        clock = time.perf_counter_ns
+        barrier.wait()
+        for number in range(per_thread):
+            start = clock()
+            logger.log(log_levels[number % len(log_levels)], f"request {number} served in {number % 997} ms")
+            samples.append(clock() - start)
+
+    workers = [threading.Thread(target=produce, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    logger.close()
+    if cleanup is not None:
+        cleanup()
+
+    samples = sorted(sample for thread_samples in latencies for sample in thread_samples)
+    return {
+        'records': len(samples),
+        'records_per_sec': len(samples) / elapsed if elapsed else 0.0,
+        'p50_us': samples[len(samples) // 2] / 1000,
+        'p99_us': samples[min(int(len(samples) * 0.99), len(samples) - 1)] / 1000,
+    }
+
+
+def relative_spread(values: list[float]) -> float:
+    middle = statistics.median(values)
+    if not middle:
+        return 0.0
+    return statistics.median(abs(value - middle) for value in values) / middle
+
+
+def summarize(runs: list[dict], threads: int) -> dict:
+    result = {'records': runs[0]['records'], 'threads': threads, 'repeat': len(runs)}
+    for metric in METRICS:
+        values = [run[metric] for run in runs]
+        result[metric] = statistics.median(values)
+        result[f'{metric}_spread'] = relative_spread(values)
+    return result
+
+
+def run(records: int, threads: tuple, repeat: int, warmup: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        suites = (
+            ('Lab3', lab3_scenarios(directory), (Lab3.LogLevel.INFO, Lab3.LogLevel.WARN, Lab3.LogLevel.ERROR)),
+            ('lab_3', lab_3_scenarios(directory), (LogLevel.INFO, LogLevel.WARN, LogLevel.ERROR)),
+        )
+        cases = [(f'{suite}/{name}/t{thread_count}', build, log_levels, thread_count)
+                 for suite, scenarios, log_levels in suites
+                 for name, build in scenarios.items()
+                 for thread_count in threads]
+
+        for _ in range(warmup):
+            for key, build, log_levels, thread_count in cases:
+                run_scenario(build, log_levels, records, thread_count)
+
+        runs = {key: [] for key, *_ in cases}
+        thread_counts = {key: thread_count for key, _, _, thread_count in cases}
+        for _ in range(repeat):
+            for key, build, log_levels, thread_count in cases:
+                runs[key].append(run_scenario(build, log_levels, records, thread_count))
+
+    results = {}
+    for key, scenario_runs in runs.items():
+        results[key] = summarize(scenario_runs, thread_counts[key])
+        print(f"{key:32} {results[key]['records_per_sec']:>12.0f} rec/s "
+              f"+/-{results[key]['records_per_sec_spread']:5.1%}  "
+              f"p99 {results[key]['p99_us']:>9.1f} us +/-{results[key]['p99_us_spread']:5.1%}")
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'records': records,
+            'repeat': repeat,
+            'warmup': warmup,
+        },
+        'results': results,
+    }
+
+
+def noise_threshold(result: dict, reference: dict, metric: str, tolerance: float, noise_factor: float) -> float:
+    noise = max(result.get(f'{metric}_spread', 0.0), reference.get(f'{metric}_spread', 0.0))
+    return max(tolerance, noise_factor * noise)
+
+
+def compare(current: dict, baseline: dict, tolerance: float, p99_tolerance: float, p99_floor_us: float,
+            noise_factor: float, p99_max_threads: int) -> list[str]:
+    regressions = []
+    for key, result in current['results'].items():
+        reference = baseline.get('results', {}).get(key)
+        if reference is None:
+            continue
+        throughput = result['records_per_sec'] / reference['records_per_sec'] if reference['records_per_sec'] else 1.0
+        latency = result['p99_us'] / reference['p99_us'] if reference['p99_us'] else 1.0
+        throughput_limit = noise_threshold(result, reference, 'records_per_sec', tolerance, noise_factor)
+        latency_limit = noise_threshold(result, reference, 'p99_us', p99_tolerance, noise_factor)
+        print(f"{key:32} throughput x{throughput:5.2f} (limit x{1 - throughput_limit:4.2f})  "
+              f"p99 x{latency:5.2f} (limit x{1 + latency_limit:4.2f})")
+        if throughput < 1 - throughput_limit:
+            regressions.append(f"{key}: throughput {throughput:.2f}x of baseline")
+        gated = result.get('threads', 1) <= p99_max_threads
+        if gated and latency > 1 + latency_limit and result['p99_us'] - reference['p99_us'] > p99_floor_us:
+            regressions.append(f"{key}: p99 latency {latency:.2f}x of baseline")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Logger pipeline throughput benchmark')
+    parser.add_argument('--records', type=int, default=20000, help='records per scenario, split across producers')
+    parser.add_argument('--threads', type=int, nargs='+', default=list(THREADS))
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(__file__), 'results.json'))
+    parser.add_argument('--baseline', default=os.path.join(os.path.dirname(__file__), 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true', help='store this run as the new baseline')
+    parser.add_argument('--repeat', type=int, default=5, help='measured runs per scenario; the median is reported')
+    parser.add_argument('--warmup', type=int, default=1, help='discarded runs per scenario before measuring')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative throughput regression')
+    parser.add_argument('--p99-tolerance', type=float, default=0.5, help='allowed relative p99 latency regression')
+    parser.add_argument('--p99-floor-us', type=float, default=5.0,
+                        help='p99 increases smaller than this many microseconds are never reported')
+    parser.add_argument('--p99-max-threads', type=int, default=1,
+                        help='gate p99 only for scenarios with at most this many producers; with more, per-call '
+                             'latency is dominated by GIL hand-offs between producer threads')
+    parser.add_argument('--noise-factor', type=float, default=3.0,
+                        help='widen each limit to this multiple of the measured run-to-run spread')
+    args = parser.parse_args()
+
+    current = run(args.records, tuple(args.threads), max(args.repeat, 1), max(args.warmup, 0))
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(current, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(current, file, indent=2)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as file:
+        regressions = compare(current, json.load(file), args.tolerance, args.p99_tolerance, args.p99_floor_us,
+                              args.noise_factor, args.p99_max_threads)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+from Filters.ILogFilter import ILogFilter
+from Formatters.ILogFormatter import ILogFormatter
+from Handlers.IAsyncLogHandler import IAsyncLogHandler
+from Handlers.ILogHandler import ILogHandler
+from LogLevel import LogLevel
+from Logger import Logger
+from typing import Any, Callable
+import asyncio
+import functools
+import time
+
+class AsyncLogger(Logger):
+    def __init__(self, filters: list[ILogFilter], formaters: list[ILogFormatter],
+                 handlers: list[ILogHandler | IAsyncLogHandler], **options: Any) -> None:
+        super().__init__(filters, formaters, handlers, **options)
+
+    def _refresh_routes(self) -> None:
+        super()._refresh_routes()
+        self._split_routes = {
+            level: (tuple(handler for handler in handlers if not isinstance(handler, IAsyncLogHandler)),
+                    tuple(handler for handler in handlers if isinstance(handler, IAsyncLogHandler)))
+            for level, handlers in self._routes.items()
+        }
+
+    def _dispatch(self, log_level: LogLevel, text: str | Callable[[], str], args: tuple,
+                  fields: dict[str, Any] | None = None) -> list[asyncio.Future]:
+        if not self._routes[log_level]:
+            return []
+
+        text = self._prepare(log_level, text, args)
+        if text is None:
+            return []
+
+        sync_handlers, async_handlers = self._split_routes[log_level]
+        if sync_handlers:
+            self._deliver(sync_handlers, log_level, text, fields)
+
+        waiters = []
+        for handler in async_handlers:
+            start = time.perf_counter_ns()
+            try:
+                waiter = handler.submit(log_level, text)
+            except Exception as e:
+                self._handler_failed(handler, e)
+                continue
+            waiter.add_done_callback(functools.partial(self._async_done, handler, start))
+            waiters.append(waiter)
+            self._handler_stats[id(handler)] = self._handler_stats.get(id(handler), 0) + 1
+        return waiters
+
+    def _async_done(self, handler: IAsyncLogHandler, start: int, done: asyncio.Future) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.record(handler, time.perf_counter_ns() - start)
+        if not done.cancelled() and done.exception() is not None:
+            self._handler_failed(handler, done.exception())
+
+    async def alog(self, log_level: LogLevel, text: str | Callable[[], str], *args: Any,
+                   fields: dict[str, Any] | None = None) -> None:
+        waiters = self._dispatch(log_level, text, args, fields)
+        if waiters:
+            await asyncio.gather(*waiters)
+
+    def log_nowait(self, log_level: LogLevel, text: str | Callable[[], str], *args: Any,
+                   fields: dict[str, Any] | None = None) -> None:
+        self._dispatch(log_level, text, args, fields)
+
+    def log(self, log_level: LogLevel, text: str | Callable[[], str], *args: Any,
+            fields: dict[str, Any] | None = None) -> None:
+        self._dispatch(log_level, text, args, fields)
+
+    def _reject_async(self, method: str) -> None:
+        if any(isinstance(handler, IAsyncLogHandler) for handler in self.handlers):
+            raise TypeError(f"AsyncLogger has asynchronous handlers, await a{method}() instead of {method}()")
+
+    def flush(self) -> None:
+        self._reject_async('flush')
+        super().flush()
+
+    def close(self) -> None:
+        self._reject_async('close')
+        super().close()
+
+    async def aflush(self) -> None:
+        for filtrator in self.filters:
+            filtrator.flush()
+        for handler in self.handlers:
+            if isinstance(handler, IAsyncLogHandler):
+                await handler.flush()
+            else:
+                handler.flush()
+
+    async def aclose(self) -> None:
+        for filtrator in self.filters:
+            filtrator.close()
+        for handler in self.handlers:
+            if isinstance(handler, IAsyncLogHandler):
+                await handler.close()
+            else:
+                handler.close()
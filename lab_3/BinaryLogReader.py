@@ -0,0 +1,101 @@
+from Handlers.BinaryFileHandler import BinaryFileHandler
+from LogLevel import LogLevel
+from typing import Any, Iterator
+import bisect
+import json
+import mmap
+import os
+
+class BinaryLogReader:
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._size = size
+        self._index = {}
+        self.bucket_seconds = None
+        self._load_index(file_path + '.idx')
+        self._starts = sorted(levels[BinaryFileHandler.ANY_LEVEL] for levels in self._index.values()
+                              if BinaryFileHandler.ANY_LEVEL in levels)
+        self._buckets = sorted(self._index)
+
+    def _load_index(self, index_path: str) -> None:
+        if not os.path.exists(index_path):
+            return
+
+        entry = BinaryFileHandler.INDEX_ENTRY
+        with open(index_path, 'rb') as file:
+            data = file.read()
+        for position in range(0, len(data) - entry.size + 1, entry.size):
+            bucket, level, offset = entry.unpack_from(data, position)
+            if level == BinaryFileHandler.META_LEVEL:
+                self.bucket_seconds = bucket
+            elif offset < self._size:
+                self._index.setdefault(bucket, {}).setdefault(level, offset)
+
+    def _read(self, offset: int) -> tuple[int, tuple[float, LogLevel, str, dict[str, Any]]]:
+        length, = BinaryFileHandler.LENGTH.unpack_from(self._map, offset)
+        body = offset + BinaryFileHandler.LENGTH.size
+        timestamp, level, message_len = BinaryFileHandler.HEADER.unpack_from(self._map, body)
+        start = body + BinaryFileHandler.HEADER.size
+        message = self._map[start:start + message_len].decode('utf-8')
+        extra = self._map[start + message_len:body + length]
+        fields = json.loads(extra) if extra else {}
+        return body + length, (timestamp, LogLevel(level), message, fields)
+
+    def _scan(self, offset: int, stop: int) -> Iterator[tuple[float, LogLevel, str, dict[str, Any]]]:
+        header_size = BinaryFileHandler.LENGTH.size + BinaryFileHandler.HEADER.size
+        while offset + header_size <= stop:
+            length, = BinaryFileHandler.LENGTH.unpack_from(self._map, offset)
+            if offset + BinaryFileHandler.LENGTH.size + length > self._size:
+                return
+            offset, record = self._read(offset)
+            yield record
+
+    def records(self, start: float | None = None, end: float | None = None,
+                level: LogLevel | None = None) -> Iterator[tuple[float, LogLevel, str, dict[str, Any]]]:
+        if not self._index:
+            for record in self._scan(0, self._size):
+                if self._accepts(record, start, end, level):
+                    yield record
+            return
+
+        key = BinaryFileHandler.ANY_LEVEL if level is None else level.value
+        first = 0 if start is None else max(bisect.bisect_right(self._buckets, start) - 1, 0)
+        for bucket in self._buckets[first:]:
+            if end is not None and bucket > end:
+                break
+
+            offset = self._index[bucket].get(key)
+            if offset is None:
+                continue
+
+            position = bisect.bisect_right(self._starts, offset)
+            stop = self._starts[position] if position < len(self._starts) else self._size
+            for record in self._scan(offset, stop):
+                if self._accepts(record, start, end, level):
+                    yield record
+
+    @staticmethod
+    def _accepts(record: tuple, start: float | None, end: float | None, level: LogLevel | None) -> bool:
+        timestamp, record_level, _, _ = record
+        if level is not None and record_level is not level:
+            return False
+        if start is not None and timestamp < start:
+            return False
+        return end is None or timestamp <= end
+
+    def levels(self, bucket: int) -> list[LogLevel]:
+        return [LogLevel(level) for level in self._index.get(bucket, {}) if level != BinaryFileHandler.ANY_LEVEL]
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "BinaryLogReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class BreakerState(Enum):
+    CLOSED = 1
+    OPEN = 2
+    HALF_OPEN = 3
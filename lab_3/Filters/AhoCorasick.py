@@ -0,0 +1,64 @@
+from collections import deque
+
+class AhoCorasick:
+    def __init__(self, keywords: list[str]) -> None:
+        self.keywords = list(keywords)
+        self.full_mask = (1 << len(self.keywords)) - 1
+        self.empty_mask = 0
+
+        goto = [{}]
+        outputs = [0]
+        for index, keyword in enumerate(self.keywords):
+            if not keyword:
+                self.empty_mask |= 1 << index
+                continue
+
+            node = 0
+            for char in keyword:
+                if char not in goto[node]:
+                    goto.append({})
+                    outputs.append(0)
+                    goto[node][char] = len(goto) - 1
+                node = goto[node][char]
+            outputs[node] |= 1 << index
+
+        fail = [0] * len(goto)
+        transitions = [dict(goto[0])] + [None] * (len(goto) - 1)
+        order = deque(goto[0].values())
+        while order:
+            node = order.popleft()
+            outputs[node] |= outputs[fail[node]]
+            transitions[node] = dict(transitions[fail[node]])
+            for char, child in goto[node].items():
+                transitions[node][char] = child
+                fail[child] = transitions[fail[node]].get(char, 0) if node else 0
+                order.append(child)
+
+        self._transitions = transitions
+        self._outputs = outputs
+
+    def scan(self, text: str, stop_mask: int = -1) -> int:
+        transitions = self._transitions
+        outputs = self._outputs
+        found = self.empty_mask
+        node = 0
+        for char in text:
+            node = transitions[node].get(char, 0)
+            if outputs[node]:
+                found |= outputs[node]
+                if found & stop_mask == stop_mask:
+                    break
+        return found
+
+    def scan_any(self, text: str) -> bool:
+        if self.empty_mask:
+            return True
+
+        transitions = self._transitions
+        outputs = self._outputs
+        node = 0
+        for char in text:
+            node = transitions[node].get(char, 0)
+            if outputs[node]:
+                return True
+        return False
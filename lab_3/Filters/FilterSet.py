@@ -0,0 +1,151 @@
+import re
+from Filters.AhoCorasick import AhoCorasick
+from Filters.ILogFilter import ILogFilter
+from Filters.ReLogFilter import ReLogFilter
+from Filters.SimpleLogFilter import SimpleLogFilter
+from LogLevel import LogLevel
+
+class FilterSet(ILogFilter):
+    AUTOMATON_MIN_KEYWORDS = 128
+
+    def __init__(self, keywords: list[str] = None, patterns: list[str] = None, match_all: bool = True,
+                 ignore_case: bool = False, filters: list[ILogFilter] = None) -> None:
+        self.keywords = list(keywords or [])
+        self.patterns = list(patterns or [])
+        self.match_all = match_all
+        self.ignore_case = ignore_case
+        self.filters = list(filters or [])
+        self.stateful = any(filtrator.stateful for filtrator in self.filters)
+
+        self._keywords = [keyword.lower() for keyword in self.keywords] if ignore_case else self.keywords
+        self._automaton = None
+        if len(self._keywords) >= self.AUTOMATON_MIN_KEYWORDS:
+            self._automaton = AhoCorasick(self._keywords)
+
+        flags = re.IGNORECASE if ignore_case else 0
+        self.invalid = []
+        compiled = []
+        for pattern in self.patterns:
+            try:
+                compiled.append(re.compile(pattern, flags))
+            except re.error:
+                self.invalid.append(pattern)
+
+        self._compiled = compiled
+        self._combined = self._combine(compiled, flags)
+
+    @classmethod
+    def from_filters(cls, filters: list[ILogFilter], match_all: bool = True, ignore_case: bool = False) -> "FilterSet":
+        keywords = []
+        patterns = []
+        rest = []
+        for filtrator in filters:
+            if type(filtrator) is SimpleLogFilter:
+                keywords.append(filtrator.filter_str)
+            elif type(filtrator) is ReLogFilter:
+                patterns.append(filtrator.pattern)
+            else:
+                rest.append(filtrator)
+        return cls(keywords, patterns, match_all, ignore_case, rest)
+
+    def _combine(self, compiled: list[re.Pattern], flags: int) -> re.Pattern | None:
+        if len(compiled) < (3 if self.match_all else 2) or any(re.search(r'\\\d|\(\?P=', pattern.pattern) for pattern in compiled):
+            return None
+
+        if self.match_all:
+            source = ''.join(f'(?=(?P<f{index}>{pattern.pattern})\\Z)' for index, pattern in enumerate(compiled))
+        else:
+            source = '|'.join(f'(?P<f{index}>{pattern.pattern})' for index, pattern in enumerate(compiled))
+
+        try:
+            return re.compile(source, flags)
+        except re.error:
+            return None
+
+    def match(self, log_level: LogLevel, text: str) -> bool:
+        if self.match_all:
+            return self._match_all(log_level, text)
+        return self._match_any(log_level, text)
+
+    def _match_all(self, log_level: LogLevel, text: str) -> bool:
+        if self.invalid:
+            return False
+
+        if self._keywords:
+            haystack = text.lower() if self.ignore_case else text
+            if self._automaton is not None:
+                automaton = self._automaton
+                if automaton.scan(haystack, automaton.full_mask) != automaton.full_mask:
+                    return False
+            elif not all(keyword in haystack for keyword in self._keywords):
+                return False
+
+        if self._combined is not None:
+            if self._combined.match(text) is None:
+                return False
+        else:
+            for pattern in self._compiled:
+                if pattern.fullmatch(text) is None:
+                    return False
+
+        for filtrator in self.filters:
+            if not filtrator.match(log_level, text):
+                return False
+
+        return True
+
+    def _match_any(self, log_level: LogLevel, text: str) -> bool:
+        if self._keywords:
+            haystack = text.lower() if self.ignore_case else text
+            if self._automaton is not None:
+                if self._automaton.scan_any(haystack):
+                    return True
+            elif any(keyword in haystack for keyword in self._keywords):
+                return True
+
+        if self._combined is not None:
+            if self._combined.fullmatch(text) is not None:
+                return True
+        else:
+            for pattern in self._compiled:
+                if pattern.fullmatch(text) is not None:
+                    return True
+
+        for filtrator in self.filters:
+            if filtrator.match(log_level, text):
+                return True
+
+        return False
+
+    def levels(self) -> set[LogLevel] | None:
+        if not self.match_all:
+            return None
+
+        enabled = None
+        for filtrator in self.filters:
+            levels = filtrator.levels()
+            if levels is not None:
+                enabled = set(levels) if enabled is None else enabled & levels
+        return enabled
+
+    def flush(self) -> None:
+        for filtrator in self.filters:
+            filtrator.flush()
+
+    def close(self) -> None:
+        for filtrator in self.filters:
+            filtrator.close()
+
+    def matching_pattern(self, text: str) -> str | None:
+        if self._combined is not None and not self.match_all:
+            found = self._combined.fullmatch(text)
+            if found is None:
+                return None
+            for index, pattern in enumerate(self._compiled):
+                if found.group(f'f{index}') is not None:
+                    return pattern.pattern
+
+        for pattern in self._compiled:
+            if pattern.fullmatch(text) is not None:
+                return pattern.pattern
+        return None
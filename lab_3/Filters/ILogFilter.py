@@ -1,5 +1,16 @@
 from LogLevel import LogLevel
 
 class ILogFilter:
+    stateful: bool = False
+
     def match(self, log_level: LogLevel, text: str) -> bool:
-        ...
\ No newline at end of file
+        ...
+
+    def levels(self) -> set[LogLevel] | None:
+        return None
+
+    def flush(self) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
@@ -6,4 +6,7 @@ class LevelLogFilter(ILogFilter):
         self.level = level
 
     def match(self, log_level: LogLevel, text: str) -> bool:
-        return log_level.value == self.level.value
\ No newline at end of file
+        return log_level.value == self.level.value
+
+    def levels(self) -> set[LogLevel] | None:
+        return {self.level}
@@ -0,0 +1,110 @@
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+from Filters.ILogFilter import ILogFilter
+from LogLevel import LogLevel
+
+class RateLimitFilter(ILogFilter):
+    _DIGITS = re.compile(r'\d+')
+    stateful = True
+
+    def __init__(self, rate: float = 10.0, burst: int = 20, key: str | Callable[[LogLevel, str], Hashable] = 'level',
+                 pattern: str | None = None, sample_rates: dict[LogLevel, float] | None = None,
+                 summary: Callable[[LogLevel, str], None] | None = None, summary_interval: float = 10.0,
+                 max_keys: int = 10000) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.sample_rates = sample_rates or {}
+        self.summary = summary
+        self.summary_interval = summary_interval
+        self.max_keys = max_keys
+        self.suppressed = 0
+        self.sampled_out = 0
+
+        self._pattern = re.compile(pattern) if pattern is not None else None
+        self._key = key if callable(key) else self._key_function(key)
+        self._buckets = OrderedDict()
+        self._pending_summary = 0
+        self._last_summary = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._closed = False
+
+    def _key_function(self, key: str) -> Callable[[LogLevel, str], Hashable]:
+        if key == 'level':
+            return lambda log_level, text: log_level
+        if key == 'text':
+            return lambda log_level, text: (log_level, text)
+        if key == 'template':
+            return lambda log_level, text: (log_level, self._DIGITS.sub('#', text))
+        if key == 'regex':
+            if self._pattern is None:
+                raise ValueError("key='regex' requires a pattern")
+            return self._capture
+        raise ValueError(f"Unknown rate limit key '{key}'")
+
+    def _capture(self, log_level: LogLevel, text: str) -> Hashable:
+        found = self._pattern.search(text)
+        if found is None:
+            return (log_level, None)
+        return (log_level, found.group(1) if found.re.groups else found.group(0))
+
+    def match(self, log_level: LogLevel, text: str) -> bool:
+        sample_rate = self.sample_rates.get(log_level)
+        key = self._key(log_level, text)
+        now = time.monotonic()
+
+        with self._lock:
+            if sample_rate is not None and random.random() >= sample_rate:
+                self.sampled_out += 1
+                passed = False
+            else:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = [float(self.burst), now]
+                    if len(self._buckets) > self.max_keys:
+                        self._buckets.popitem(last=False)
+                else:
+                    self._buckets.move_to_end(key)
+                    bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+                    bucket[1] = now
+
+                passed = bucket[0] >= 1.0
+                if passed:
+                    bucket[0] -= 1.0
+                else:
+                    self.suppressed += 1
+
+            if not passed and self.summary is not None:
+                self._pending_summary += 1
+                if self._timer is None and not self._closed:
+                    delay = max(self._last_summary + self.summary_interval - now, 0.0)
+                    self._timer = threading.Timer(delay, self._emit_summary)
+                    self._timer.daemon = True
+                    self._timer.start()
+        return passed
+
+    def _emit_summary(self) -> None:
+        with self._lock:
+            self._timer = None
+            report, self._pending_summary = self._pending_summary, 0
+            self._last_summary = time.monotonic()
+
+        if report:
+            self.summary(LogLevel.WARN, f"{report} records suppressed")
+
+    def flush(self) -> None:
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        if self.summary is not None:
+            self._emit_summary()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        self.flush()
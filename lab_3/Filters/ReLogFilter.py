@@ -5,14 +5,16 @@ from LogLevel import LogLevel
 class ReLogFilter(ILogFilter):
     def __init__(self, pattern: str) -> None:
         self.pattern = pattern
+        try:
+            self._compiled = re.compile(pattern)
+        except re.error:
+            self._compiled = None
 
     def match(self, log_level: LogLevel, text: str) -> bool:
-        try:
-            re.compile(self.pattern)
-        except:
+        if self._compiled is None:
             return
 
-        if re.fullmatch(self.pattern, text) == None:
+        if self._compiled.fullmatch(text) == None:
             return False
         
-        return True
\ No newline at end of file
+        return True
@@ -0,0 +1,48 @@
+import string
+
+class CompiledTemplate:
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.head = None
+        self.tail = None
+
+        pieces = list(string.Formatter().parse(template))
+        text_fields = [index for index, piece in enumerate(pieces) if piece[1] == 'text']
+        if len(text_fields) != 1:
+            return
+
+        index = text_fields[0]
+        literal, _, format_spec, conversion = pieces[index]
+        if format_spec or conversion:
+            return
+
+        self.head = self._source(pieces[:index]) + self._escape(literal)
+        self.tail = self._source(pieces[index + 1:])
+
+    @staticmethod
+    def _escape(literal: str) -> str:
+        return literal.replace('{', '{{').replace('}', '}}')
+
+    def _source(self, pieces: list[tuple]) -> str:
+        source = ''
+        for literal, field_name, format_spec, conversion in pieces:
+            source += self._escape(literal)
+            if field_name is None:
+                continue
+            source += '{' + field_name
+            if conversion:
+                source += '!' + conversion
+            if format_spec:
+                source += ':' + format_spec
+            source += '}'
+        return source
+
+    @property
+    def splittable(self) -> bool:
+        return self.head is not None
+
+    def split(self, **fields) -> tuple[str, str]:
+        return self.head.format(**fields), self.tail.format(**fields)
+
+    def render(self, **fields) -> str:
+        return self.template.format(**fields)
@@ -1,9 +1,28 @@
 from LogLevel import LogLevel
 from Formatters.ILogFormatter import ILogFormatter
+from Formatters.CompiledTemplate import CompiledTemplate
 import time
 
 class SimpleFormatter(ILogFormatter):
+    def __init__(self, template: str = '[{level}] [{time}] {text}') -> None:
+        self.template = CompiledTemplate(template)
+        self._state = (None, '', {})
+
+    def _time_str(self, second: int) -> str:
+        time_gm = time.gmtime(second)
+        return f'{time_gm.tm_year}.{time_gm.tm_mon}.{time_gm.tm_mday} {time_gm.tm_hour}:{time_gm.tm_min}:{time_gm.tm_sec}'
+
     def format(self, log_level: LogLevel, text: str) -> str:
-        time_gm = time.gmtime()
-        time_str = f'{time_gm.tm_year}.{time_gm.tm_mon}.{time_gm.tm_mday} {time_gm.tm_hour}:{time_gm.tm_min}:{time_gm.tm_sec}'
-        return f'[{log_level.name}] [{time_str}] {text}'
+        second = int(time.time())
+        state = self._state
+        if state[0] != second:
+            state = (second, self._time_str(second), {})
+            self._state = state
+
+        if not self.template.splittable:
+            return self.template.render(level=log_level.name, time=state[1], text=text)
+
+        parts = state[2].get(log_level)
+        if parts is None:
+            parts = state[2][log_level] = self.template.split(level=log_level.name, time=state[1])
+        return parts[0] + text + parts[1]
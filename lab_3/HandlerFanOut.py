@@ -0,0 +1,117 @@
+from Handlers.ILogHandler import ILogHandler
+from LogLevel import LogLevel
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from typing import Any, Callable
+import threading
+import time
+
+class _Lane:
+    def __init__(self, handler: ILogHandler, pool: ThreadPoolExecutor, max_pending: int) -> None:
+        self.handler = handler
+        self.pool = pool
+        self.max_pending = max_pending
+        self.dropped = 0
+        self.failed = 0
+        self._pending = deque()
+        self._running = False
+        self._started = None
+        self._lock = threading.Lock()
+
+    def stalled(self, timeout: float) -> bool:
+        started = self._started
+        return started is not None and time.monotonic() - started > timeout
+
+    def submit(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None = None) -> Future:
+        future = Future()
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                future.set_result(None)
+                return future
+            self._pending.append((log_level, text, fields, future))
+            if self._running:
+                return future
+            self._running = True
+        self.pool.submit(self._drain)
+        return future
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._running = False
+                    return
+                log_level, text, fields, future = self._pending.popleft()
+
+            self._started = time.monotonic()
+            try:
+                if fields is None:
+                    self.handler.handle(log_level, text)
+                else:
+                    self.handler.handle_record(log_level, text, fields)
+                future.set_result(None)
+            except Exception as e:
+                self.failed += 1
+                future.set_exception(e)
+            finally:
+                self._started = None
+
+class HandlerFanOut:
+    _shared_pool = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool: ThreadPoolExecutor | None = None, timeout: float = 1.0, max_pending: int = 10000) -> None:
+        self.pool = pool if pool is not None else HandlerFanOut.shared_pool()
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.timed_out = {}
+        self._timeouts = {}
+        self._lanes = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared_pool(cls, workers: int = 8) -> ThreadPoolExecutor:
+        with cls._shared_lock:
+            if cls._shared_pool is None:
+                cls._shared_pool = ThreadPoolExecutor(workers, thread_name_prefix='log-fanout')
+            return cls._shared_pool
+
+    def set_timeout(self, handler: ILogHandler, timeout: float) -> None:
+        self._timeouts[id(handler)] = timeout
+
+    def _lane(self, handler: ILogHandler) -> _Lane:
+        lane = self._lanes.get(id(handler))
+        if lane is None:
+            with self._lock:
+                lane = self._lanes.get(id(handler))
+                if lane is None:
+                    lane = self._lanes[id(handler)] = _Lane(handler, self.pool, self.max_pending)
+        return lane
+
+    def dispatch(self, handlers: tuple[ILogHandler, ...], log_level: LogLevel, text: str,
+                 on_error: Callable[[ILogHandler, Exception], None] | None = None,
+                 fields: dict[str, Any] | None = None) -> None:
+        lanes = [self._lane(handler) for handler in handlers]
+        futures = [lane.submit(log_level, text, fields) for lane in lanes]
+
+        start = time.monotonic()
+        for handler, lane, future in zip(handlers, lanes, futures):
+            timeout = self._timeouts.get(id(handler), self.timeout)
+            remaining = 0 if lane.stalled(timeout) else start + timeout - time.monotonic()
+            try:
+                future.result(max(remaining, 0))
+            except TimeoutError:
+                self.timed_out[id(handler)] = self.timed_out.get(id(handler), 0) + 1
+            except Exception as e:
+                if on_error is not None:
+                    on_error(handler, e)
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [{
+            'handler': type(lane.handler).__name__,
+            'pending': len(lane._pending),
+            'timed_out': self.timed_out.get(key, 0),
+            'failed': lane.failed,
+            'dropped': lane.dropped,
+        } for key, lane in list(self._lanes.items())]
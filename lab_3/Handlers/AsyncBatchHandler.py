@@ -0,0 +1,51 @@
+from LogLevel import LogLevel
+from Handlers.IAsyncLogHandler import IAsyncLogHandler
+import asyncio
+
+class AsyncBatchHandler(IAsyncLogHandler):
+    def __init__(self) -> None:
+        self.batches = 0
+        self.failed = 0
+        self._batch = []
+        self._waiter = None
+        self._tasks = set()
+        self._write_lock = None
+
+    def submit(self, log_level: LogLevel, text: str) -> asyncio.Future:
+        if self._waiter is None:
+            loop = asyncio.get_running_loop()
+            self._waiter = loop.create_future()
+            loop.call_soon(self._start_batch)
+
+        self._batch.append((log_level, text))
+        return self._waiter
+
+    def _start_batch(self) -> None:
+        batch, waiter = self._batch, self._waiter
+        self._batch, self._waiter = [], None
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+
+        task = asyncio.get_running_loop().create_task(self._write(batch, waiter))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: list[tuple[LogLevel, str]], waiter: asyncio.Future) -> None:
+        async with self._write_lock:
+            try:
+                await self.write_batch(batch)
+                self.batches += 1
+            except Exception:
+                self.failed += 1
+            finally:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def write_batch(self, batch: list[tuple[LogLevel, str]]) -> None:
+        ...
+
+    async def flush(self) -> None:
+        if self._waiter is not None:
+            await self._waiter
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
@@ -0,0 +1,30 @@
+from LogLevel import LogLevel
+from Handlers.AsyncBatchHandler import AsyncBatchHandler
+from concurrent.futures import Executor
+import asyncio
+
+class AsyncFileHandler(AsyncBatchHandler):
+    def __init__(self, file_path: str, executor: Executor | None = None) -> None:
+        super().__init__()
+        self.file_path = file_path
+        self.executor = executor
+        self._file = None
+
+    def _write_blocking(self, data: bytes) -> None:
+        if self._file is None:
+            self._file = open(self.file_path, 'ab')
+        self._file.write(data)
+        self._file.flush()
+
+    async def write_batch(self, batch: list[tuple[LogLevel, str]]) -> None:
+        data = ''.join(text + '\n' for _, text in batch).encode('utf-8')
+        await asyncio.get_running_loop().run_in_executor(self.executor, self._write_blocking, data)
+
+    def _close_blocking(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def close(self) -> None:
+        await self.flush()
+        await asyncio.get_running_loop().run_in_executor(self.executor, self._close_blocking)
@@ -0,0 +1,64 @@
+from LogLevel import LogLevel
+from Handlers.AsyncBatchHandler import AsyncBatchHandler
+import asyncio
+import struct
+import time
+
+class AsyncSocketHandler(AsyncBatchHandler):
+    def __init__(self, host: str, port: int, timeout: float = 1.0, backoff_initial: float = 0.1,
+                 backoff_max: float = 30.0) -> None:
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.dropped = 0
+
+        self._writer = None
+        self._backoff = backoff_initial
+        self._retry_at = 0.0
+
+    async def _connect(self) -> bool:
+        if self._writer is not None:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+
+        try:
+            _, self._writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+            self._backoff = self.backoff_initial
+            return True
+        except (OSError, asyncio.TimeoutError):
+            self._retry_at = time.monotonic() + self._backoff
+            self._backoff = min(self._backoff * 2, self.backoff_max)
+            return False
+
+    async def write_batch(self, batch: list[tuple[LogLevel, str]]) -> None:
+        if not await self._connect():
+            self.dropped += len(batch)
+            return
+
+        frames = []
+        for _, text in batch:
+            payload = text.encode('utf-8')
+            frames.append(struct.pack('>I', len(payload)))
+            frames.append(payload)
+
+        try:
+            self._writer.write(b''.join(frames))
+            await asyncio.wait_for(self._writer.drain(), self.timeout)
+        except (OSError, asyncio.TimeoutError):
+            self.dropped += len(batch)
+            self._writer.close()
+            self._writer = None
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
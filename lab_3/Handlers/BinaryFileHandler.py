@@ -0,0 +1,82 @@
+from LogLevel import LogLevel
+from Handlers.ILogHandler import ILogHandler
+from typing import Any
+import json
+import struct
+import threading
+import time
+
+class BinaryFileHandler(ILogHandler):
+    LENGTH = struct.Struct('<I')
+    HEADER = struct.Struct('<dBI')
+    INDEX_ENTRY = struct.Struct('<qBQ')
+    ANY_LEVEL = 0
+    META_LEVEL = 255
+
+    def __init__(self, file_path: str, bucket_seconds: int = 60, flush_every: int = 1) -> None:
+        self.file_path = file_path
+        self.index_path = file_path + '.idx'
+        self.bucket_seconds = bucket_seconds
+        self.flush_every = flush_every
+
+        self._lock = threading.Lock()
+        self._file = open(file_path, 'ab')
+        self._index = open(self.index_path, 'ab')
+        self._offset = self._file.tell()
+        if self._index.tell() == 0:
+            self._index.write(self.INDEX_ENTRY.pack(bucket_seconds, self.META_LEVEL, 0))
+        self._bucket = None
+        self._last_timestamp = 0.0
+        self._bucket_levels = set()
+        self._pending = 0
+        self._closed = False
+
+    def handle(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None = None) -> None:
+        self.handle_record(log_level, text, fields)
+
+    def handle_record(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        message = text.encode('utf-8')
+        extra = json.dumps(fields, ensure_ascii=False).encode('utf-8') if fields else b''
+
+        with self._lock:
+            if self._closed:
+                return
+
+            timestamp = max(time.time(), self._last_timestamp)
+            self._last_timestamp = timestamp
+            body = self.HEADER.pack(timestamp, log_level.value, len(message)) + message + extra
+            record = self.LENGTH.pack(len(body)) + body
+            bucket = int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+            if bucket != self._bucket:
+                self._bucket = bucket
+                self._bucket_levels = set()
+                self._index.write(self.INDEX_ENTRY.pack(bucket, self.ANY_LEVEL, self._offset))
+            if log_level.value not in self._bucket_levels:
+                self._bucket_levels.add(log_level.value)
+                self._index.write(self.INDEX_ENTRY.pack(bucket, log_level.value, self._offset))
+
+            self._file.write(record)
+            self._offset += len(record)
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._flush()
+
+    def _flush(self) -> None:
+        self._file.flush()
+        self._index.flush()
+        self._pending = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._closed:
+                self._flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush()
+            self._file.close()
+            self._index.close()
@@ -0,0 +1,105 @@
+from LogLevel import LogLevel
+from BreakerState import BreakerState
+from Handlers.ILogHandler import ILogHandler
+from typing import Any
+import threading
+import time
+
+class CircuitBreakerHandler(ILogHandler):
+    def __init__(self, handler: ILogHandler, fallback: ILogHandler | None = None, failure_threshold: int = 5,
+                 backoff_initial: float = 1.0, backoff_max: float = 60.0) -> None:
+        self.handler = handler
+        self.fallback = fallback
+        self.failure_threshold = failure_threshold
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.successes = 0
+        self.suppressed = 0
+        self.trips = 0
+        self._backoff = backoff_initial
+        self._next_probe = 0.0
+        self._lock = threading.Lock()
+
+    def handle(self, log_level: LogLevel, text: str) -> None:
+        self.handle_record(log_level, text, None)
+
+    def handle_record(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        with self._lock:
+            if self.state is BreakerState.OPEN and time.monotonic() >= self._next_probe:
+                self.state = BreakerState.HALF_OPEN
+                probing = True
+            else:
+                probing = False
+
+            if self.state is not BreakerState.CLOSED and not probing:
+                self.suppressed += 1
+                short_circuit = True
+            else:
+                short_circuit = False
+
+        if short_circuit:
+            self._fallback(log_level, text, fields)
+            return
+
+        try:
+            self.handler.handle_record(log_level, text, fields)
+        except Exception:
+            self._on_failure(probing)
+            self._fallback(log_level, text, fields)
+            return
+
+        self._on_success()
+
+    def _on_failure(self, probing: bool) -> None:
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if probing:
+                self._backoff = min(self._backoff * 2, self.backoff_max)
+            elif self.state is not BreakerState.CLOSED or self.consecutive_failures < self.failure_threshold:
+                return
+            else:
+                self._backoff = self.backoff_initial
+
+            self.state = BreakerState.OPEN
+            self.trips += 1
+            self._next_probe = time.monotonic() + self._backoff
+
+    def _on_success(self) -> None:
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            if self.state is BreakerState.HALF_OPEN:
+                self.state = BreakerState.CLOSED
+                self._backoff = self.backoff_initial
+
+    def _fallback(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        if self.fallback is not None:
+            self.fallback.handle_record(log_level, text, fields)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'handler': type(self.handler).__name__,
+                'state': self.state.name,
+                'consecutive_failures': self.consecutive_failures,
+                'failures': self.failures,
+                'successes': self.successes,
+                'suppressed': self.suppressed,
+                'trips': self.trips,
+                'next_probe_in': max(self._next_probe - time.monotonic(), 0.0) if self.state is BreakerState.OPEN else 0.0,
+            }
+
+    def flush(self) -> None:
+        self.handler.flush()
+        if self.fallback is not None:
+            self.fallback.flush()
+
+    def close(self) -> None:
+        self.handler.close()
+        if self.fallback is not None:
+            self.fallback.close()
@@ -0,0 +1,94 @@
+from Handlers.FileHandler import FileHandler
+import gzip
+import lzma
+import os
+import queue
+import shutil
+import threading
+import time
+
+class CompressedRotatingFileHandler(FileHandler):
+    create_missing = True
+
+    def __init__(self, file_path: str, compression: str = 'gzip', max_archives: int = 10, max_age: float = 0,
+                 **options) -> None:
+        if compression not in ('gzip', 'lzma'):
+            raise ValueError(f"Unknown compression '{compression}'")
+
+        super().__init__(file_path, backup_count=max(max_archives, 1), **options)
+        self.compression = compression
+        self.max_archives = max_archives
+        self.max_age = max_age
+        self.compressed = 0
+        self.failed = 0
+
+        self._sequence = 0
+        self._segments = queue.Queue()
+        self._compressor = threading.Thread(target=self._compress_segments, daemon=True)
+        self._compressor.start()
+
+    @property
+    def suffix(self) -> str:
+        return '.gz' if self.compression == 'gzip' else '.xz'
+
+    def _archive_active(self) -> str:
+        self._sequence += 1
+        segment = f"{self.file_path}.{time.strftime('%Y%m%d-%H%M%S')}-{self._sequence}"
+        os.replace(self.file_path, segment)
+        return segment
+
+    def _rotated(self, path: str) -> None:
+        self._segments.put(path)
+
+    def _compress_segments(self) -> None:
+        while True:
+            segment = self._segments.get()
+            try:
+                if segment is None:
+                    return
+                self._compress(segment)
+                self._prune()
+            except Exception:
+                self.failed += 1
+            finally:
+                self._segments.task_done()
+
+    def _compress(self, segment: str) -> None:
+        opener = gzip.open if self.compression == 'gzip' else lzma.open
+        archive = segment + self.suffix
+        temporary = archive + '.tmp'
+        try:
+            with open(segment, 'rb') as source, opener(temporary, 'wb') as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        os.replace(temporary, archive)
+        os.remove(segment)
+        self.compressed += 1
+
+    def archives(self) -> list[str]:
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        prefix = os.path.basename(self.file_path) + '.'
+        paths = [os.path.join(directory, name) for name in os.listdir(directory)
+                 if name.startswith(prefix) and name.endswith(self.suffix)]
+        return sorted(paths, key=os.path.getmtime)
+
+    def _prune(self) -> None:
+        archives = self.archives()
+        expired = archives[:max(len(archives) - self.max_archives, 0)]
+        if self.max_age > 0:
+            oldest_allowed = time.time() - self.max_age
+            expired += [path for path in archives[len(expired):] if os.path.getmtime(path) < oldest_allowed]
+        for path in expired:
+            os.remove(path)
+
+    def flush(self) -> None:
+        super().flush()
+        self._segments.join()
+
+    def close(self) -> None:
+        super().close()
+        self._segments.put(None)
+        self._compressor.join()
@@ -0,0 +1,112 @@
+from LogLevel import LogLevel
+from Handlers.ILogHandler import ILogHandler
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+import json
+import re
+import threading
+import time
+
+class DedupHandler(ILogHandler):
+    _PREFIX = re.compile(r'\[\w+\] \[\d{4}\.\d{1,2}\.\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}\] ')
+
+    def __init__(self, handler: ILogHandler, window: float = 5.0, max_entries: int = 1024,
+                 key: Callable[[LogLevel, str], Hashable] | None = None) -> None:
+        self.handler = handler
+        self.window = window
+        self.max_entries = max_entries
+        self.key = key
+        self.collapsed = 0
+
+        self._entries = OrderedDict()
+        self._timer = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _key(self, log_level: LogLevel, text: str) -> Hashable:
+        if self.key is not None:
+            return self.key(log_level, text)
+        prefix = self._PREFIX.match(text)
+        return (log_level, text[prefix.end():] if prefix is not None else text)
+
+    def handle(self, log_level: LogLevel, text: str) -> None:
+        self.handle_record(log_level, text, None)
+
+    def handle_record(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        now = time.time()
+        key = self._key(log_level, text)
+        if fields:
+            key = (key, json.dumps(fields, sort_keys=True, default=str))
+
+        with self._lock:
+            finished = self._expire(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry[3] = now
+                entry[4] += 1
+                self.collapsed += 1
+                forward = False
+            else:
+                self._entries[key] = [log_level, text, now, now, 0, fields]
+                if len(self._entries) > self.max_entries:
+                    finished.append(self._entries.popitem(last=False)[1])
+                forward = True
+            self._schedule(now)
+
+        self._emit(finished)
+        if forward:
+            self.handler.handle_record(log_level, text, fields)
+
+    def _expire(self, now: float) -> list[list]:
+        finished = []
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if now - entry[3] < self.window:
+                break
+            finished.append(self._entries.popitem(last=False)[1])
+        return finished
+
+    def _schedule(self, now: float) -> None:
+        if self._timer is not None or self._closed or not self._entries:
+            return
+        entry = next(iter(self._entries.values()))
+        self._timer = threading.Timer(max(entry[3] + self.window - now, 0.0), self._expire_due)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _expire_due(self) -> None:
+        with self._lock:
+            self._timer = None
+            now = time.time()
+            finished = self._expire(now)
+            self._schedule(now)
+        self._emit(finished)
+
+    @staticmethod
+    def _time_str(timestamp: float) -> str:
+        time_gm = time.gmtime(timestamp)
+        return f'{time_gm.tm_year}.{time_gm.tm_mon}.{time_gm.tm_mday} {time_gm.tm_hour}:{time_gm.tm_min}:{time_gm.tm_sec}'
+
+    def _emit(self, finished: list[list]) -> None:
+        for log_level, text, first, last, count, fields in finished:
+            if count:
+                self.handler.handle_record(log_level, f"{text} [repeated {count} more times between "
+                                                      f"{self._time_str(first)} and {self._time_str(last)}]", fields)
+
+    def flush(self) -> None:
+        with self._lock:
+            finished = self._expire(time.time())
+        self._emit(finished)
+        self.handler.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            timer, self._timer = self._timer, None
+            finished = list(self._entries.values())
+            self._entries.clear()
+        if timer is not None:
+            timer.cancel()
+        self._emit(finished)
+        self.handler.close()
@@ -1,17 +1,131 @@
 from LogLevel import LogLevel
 from Handlers.ILogHandler import ILogHandler
+import locale
 import os
+import threading
+import time
 
 class FileHandler(ILogHandler):
-    def __init__(self, file_path: str) -> None:
+    create_missing = False
+
+    def __init__(self, file_path: str, flush_every: int = 1, flush_interval_ms: int = 0, flush_on_error: bool = True,
+                 fsync: bool = False, max_bytes: int = 0, rotate_interval: float = 0, backup_count: int = 5,
+                 encoding: str | None = None) -> None:
         self.file_path = file_path
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        self.flush_every = flush_every
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_on_error = flush_on_error
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+
+        self._lock = threading.RLock()
+        self._file = None
+        self._size = 0
+        self._pending = 0
+        self._rollover_at = 0.0
+        self._closed = False
+        self._stop = threading.Event()
+        self._flusher = None
+        if flush_interval_ms > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
 
     def handle(self, log_level: LogLevel, text: str) -> None:
-        if not os.path.exists(self.file_path):
+        data = (text + os.linesep).encode(self.encoding)
+
+        with self._lock:
+            if self._closed:
+                return
+
+            if self._file is None and not self._open():
+                return
+
+            if self._should_rotate(len(data)):
+                self._rotate()
+
+            self._file.write(data)
+            self._size += len(data)
+            self._pending += 1
+
+            if self._pending >= self.flush_every or (self.flush_on_error and log_level is LogLevel.ERROR):
+                self._flush()
+
+    def _open(self) -> bool:
+        if not self.create_missing and not os.path.exists(self.file_path):
+            return False
+
+        self._file = open(self.file_path, "ab")
+        self._size = self._file.tell()
+        if self.rotate_interval > 0:
+            self._rollover_at = time.time() + self.rotate_interval
+        return True
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self.backup_count <= 0:
+            return False
+        if self.max_bytes > 0 and self._size > 0 and self._size + incoming > self.max_bytes:
+            return True
+        return self.rotate_interval > 0 and time.time() >= self._rollover_at
+
+    def _rotate(self) -> None:
+        self._flush()
+        self._file.close()
+        self._file = None
+
+        rotated = self._archive_active()
+
+        self._file = open(self.file_path, "wb")
+        self._size = 0
+        if self.rotate_interval > 0:
+            self._rollover_at = time.time() + self.rotate_interval
+
+        self._rotated(rotated)
+
+    def _archive_active(self) -> str:
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.file_path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.file_path}.{index + 1}")
+        rotated = f"{self.file_path}.1"
+        os.replace(self.file_path, rotated)
+        return rotated
+
+    def _rotated(self, path: str) -> None:
+        ...
+
+    def _flush(self) -> None:
+        if self._file is None or self._pending == 0:
             return
-        
-        try:
-            with open(self.file_path, "a") as file:
-                file.write(text + '\n')
-        except:
-            return
\ No newline at end of file
+
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval_ms / 1000):
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            try:
+                self._flush()
+            except OSError:
+                return
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._stop.set()
+            try:
+                self._flush()
+                if self._file is not None:
+                    self._file.close()
+            except OSError:
+                pass
+            self._file = None
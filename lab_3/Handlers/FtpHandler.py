@@ -1,27 +1,127 @@
 from LogLevel import LogLevel
 from Handlers.ILogHandler import ILogHandler
+from ftplib import FTP
+from typing import Callable
+import io
+import threading
+import time
 
 class FtpHandler(ILogHandler):
-    def __init__(self, server: str, username: str, password: str, message_file: str) -> None:
+    def __init__(self, server: str, username: str, password: str, message_file: str, max_bytes: int = 64 * 1024,
+                 interval: float = 5.0, retries: int = 3, retry_delay: float = 1.0, spool_limit: int = 16 * 1024 * 1024,
+                 timeout: float = 10.0, ftp_factory: Callable[..., FTP] = FTP) -> None:
         self.server = server
         self.username = username
         self.password = password
         self.message_file = message_file
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.spool_limit = spool_limit
+        self.timeout = timeout
+        self.ftp_factory = ftp_factory
+        self.uploads = 0
+        self.failed_uploads = 0
+        self.dropped = 0
+
+        self._records = []
+        self._size = 0
+        self._uploading = False
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._uploader = threading.Thread(target=self._run, daemon=True)
+        self._uploader.start()
 
     def handle(self, log_level: LogLevel, text: str) -> None:
-        from ftplib import FTP
+        data = (text + '\n').encode('utf-8')
+
+        with self._cond:
+            if self._closed:
+                return
+            self._records.append(data)
+            self._size += len(data)
+            self._trim()
+            if self._size >= self.max_bytes:
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + self.interval
+                while not self._closed and not self._flush_requested and self._size < self.max_bytes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                closing = self._closed
+                self._flush_requested = False
+                records, self._records, self._size = self._records, [], 0
+                self._uploading = bool(records)
+
+            if records and not self._upload(b''.join(records)):
+                with self._cond:
+                    self._records[:0] = records
+                    self._size += sum(len(record) for record in records)
+                    self._trim()
+
+            with self._cond:
+                if closing:
+                    self.dropped += len(self._records)
+                    self._records, self._size = [], 0
+                self._uploading = False
+                self._cond.notify_all()
+
+            if closing:
+                return
+
+    def _upload(self, data: bytes) -> bool:
+        delay = self.retry_delay
+        for attempt in range(self.retries + 1):
+            try:
+                ftp = self.ftp_factory(self.server, timeout=self.timeout)
+                try:
+                    ftp.login(self.username, self.password)
+                    ftp.storbinary(f"APPE {self.message_file}", io.BytesIO(data))
+                finally:
+                    try:
+                        ftp.quit()
+                    except Exception:
+                        ftp.close()
+                self.uploads += 1
+                return True
+            except Exception:
+                if attempt == self.retries:
+                    break
+                time.sleep(delay)
+                delay *= 2
 
-        try:
-            with open(self.message_file, "w") as file:
-                file.write(text)
+        self.failed_uploads += 1
+        return False
 
-            with open(self.message_file, 'rb') as file:
-                ftp = FTP(self.server)
+    def _trim(self) -> None:
+        while self._size > self.spool_limit and self._records:
+            self._size -= len(self._records.pop(0))
+            self.dropped += 1
 
-                ftp.login(self.usernamer, self.password)
-                ftp.storbinary(f"STOR {self.message_file}", file)
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._records)
 
-                ftp.quit()
+    def flush(self) -> None:
+        with self._cond:
+            if self._closed or (not self._records and not self._uploading):
+                return
+            self._flush_requested = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: (not self._flush_requested or self._closed) and not self._uploading)
 
-        except:
-            return
\ No newline at end of file
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._uploader.join()
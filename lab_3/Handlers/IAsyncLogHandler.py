@@ -0,0 +1,15 @@
+from LogLevel import LogLevel
+import asyncio
+
+class IAsyncLogHandler:
+    def submit(self, log_level: LogLevel, text: str) -> asyncio.Future:
+        ...
+
+    async def handle(self, log_level: LogLevel, text: str) -> None:
+        await self.submit(log_level, text)
+
+    async def flush(self) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
@@ -1,5 +1,15 @@
 from LogLevel import LogLevel
+from typing import Any
 
 class ILogHandler:
     def handle(self, log_level: LogLevel, text: str) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    def handle_record(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        self.handle(log_level, text)
+
+    def flush(self) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
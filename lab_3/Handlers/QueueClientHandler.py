@@ -0,0 +1,83 @@
+from LogLevel import LogLevel
+from Handlers.ILogHandler import ILogHandler
+from typing import Any
+import os
+import threading
+import weakref
+
+class QueueClientHandler(ILogHandler):
+    def __init__(self, queue, batch_size: int = 100, interval: float = 0.5) -> None:
+        self.queue = queue
+        self.batch_size = batch_size
+        self.interval = interval
+        self._closed = False
+        self._reset()
+
+        if hasattr(os, 'register_at_fork'):
+            handler = weakref.ref(self)
+            os.register_at_fork(after_in_child=lambda: handler() is not None and handler()._reset())
+
+    def _reset(self) -> None:
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._batch = []
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        for name in ('_pid', '_start_lock', '_lock', '_batch', '_stop', '_flusher'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._reset()
+
+    def _ensure_started(self) -> None:
+        if self._pid == os.getpid():
+            return
+
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._stop = threading.Event()
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+            self._pid = os.getpid()
+
+    def handle(self, log_level: LogLevel, text: str) -> None:
+        self.handle_record(log_level, text, None)
+
+    def handle_record(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        if self._closed:
+            return
+
+        self._ensure_started()
+        with self._lock:
+            self._batch.append((log_level.value, text, fields))
+            if len(self._batch) < self.batch_size:
+                return
+            batch, self._batch = self._batch, []
+        self.queue.put(batch)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pid != os.getpid():
+            return
+
+        with self._lock:
+            batch, self._batch = self._batch, []
+        if batch:
+            self.queue.put(batch)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self.flush()
+        self._closed = True
+        if self._pid == os.getpid():
+            self._stop.set()
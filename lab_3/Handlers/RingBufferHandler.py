@@ -0,0 +1,64 @@
+from LogLevel import LogLevel
+from Handlers.ILogHandler import ILogHandler
+from typing import Any
+import threading
+
+class RingBufferHandler(ILogHandler):
+    def __init__(self, target: ILogHandler, capacity: int = 1000, trigger_level: LogLevel | None = LogLevel.ERROR) -> None:
+        self.target = target
+        self.capacity = capacity
+        self.trigger_level = trigger_level
+        self.dumps = 0
+
+        self._levels = [None] * capacity
+        self._texts = [None] * capacity
+        self._fields = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def handle(self, log_level: LogLevel, text: str) -> None:
+        self.handle_record(log_level, text, None)
+
+    def handle_record(self, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        with self._lock:
+            position = self._next
+            self._levels[position] = log_level
+            self._texts[position] = text
+            self._fields[position] = fields
+            self._next = position + 1 if position + 1 < self.capacity else 0
+            if self._count < self.capacity:
+                self._count += 1
+
+            if self.trigger_level is None or log_level.value < self.trigger_level.value:
+                return
+            records = self._drain()
+
+        self._forward(records)
+
+    def _drain(self) -> list[tuple[LogLevel, str, dict[str, Any] | None]]:
+        start = (self._next - self._count) % self.capacity
+        positions = [(start + offset) % self.capacity for offset in range(self._count)]
+        records = [(self._levels[position], self._texts[position], self._fields[position]) for position in positions]
+        self._count = 0
+        self.dumps += 1
+        return records
+
+    def _forward(self, records: list[tuple[LogLevel, str, dict[str, Any] | None]]) -> None:
+        for log_level, text, fields in records:
+            self.target.handle_record(log_level, text, fields)
+        self.target.flush()
+
+    def dump(self) -> None:
+        with self._lock:
+            records = self._drain()
+        self._forward(records)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def close(self) -> None:
+        self.target.close()
@@ -1,19 +1,126 @@
 from LogLevel import LogLevel
 from Handlers.ILogHandler import ILogHandler
+from collections import deque
+import socket
+import struct
+import threading
 
 class SocketHandler(ILogHandler):
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(self, host: str, port: int, spool_size: int = 10000, batch_size: int = 256, timeout: float = 1.0,
+                 backoff_initial: float = 0.1, backoff_max: float = 30.0, flush_timeout: float = 5.0) -> None:
         self.host = host
         self.port = port
+        self.spool_size = spool_size
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.flush_timeout = flush_timeout
+        self.sent = 0
+        self.dropped = 0
+        self.reconnects = 0
+
+        self._spool = deque()
+        self._inflight = 0
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self._sock = None
+        self._closed = False
+        self._sender = threading.Thread(target=self._run, daemon=True)
+        self._sender.start()
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
 
     def handle(self, log_level: LogLevel, text: str) -> None:
-        import socket
+        payload = text.encode('utf-8')
+        frame = struct.pack('>I', len(payload)) + payload
+
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._spool) >= self.spool_size:
+                self._spool.popleft()
+                self.dropped += 1
+            self._spool.append(frame)
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        delay = self.backoff_initial
+        while True:
+            with self._cond:
+                while not self._spool and not self._closed:
+                    self._cond.wait()
+                if not self._spool:
+                    break
+                batch = [self._spool.popleft() for _ in range(min(self.batch_size, len(self._spool)))]
+                self._inflight = len(batch)
+
+            if self._sock is None:
+                try:
+                    self._connect()
+                    delay = self.backoff_initial
+                except OSError:
+                    self._requeue(batch)
+                    if self._closed:
+                        break
+                    self._wake.wait(delay)
+                    delay = min(delay * 2, self.backoff_max)
+                    continue
+
+            try:
+                self._sock.sendall(b''.join(batch))
+            except OSError:
+                self._disconnect()
+                self._requeue(batch)
+                continue
+
+            with self._cond:
+                self.sent += len(batch)
+                self._inflight = 0
+                self._cond.notify_all()
+
+        self._disconnect()
+        with self._cond:
+            self.dropped += len(self._spool)
+            self._spool.clear()
+            self._inflight = 0
+            self._cond.notify_all()
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self.reconnects += 1
+
+    def _disconnect(self) -> None:
+        if self._sock is None:
+            return
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((self.host, self.port))
-            
-            s.sendall(text.encode('utf-8'))
-
-            s.close()
-        except:
-            return
\ No newline at end of file
+            self._sock.close()
+        except OSError:
+            pass
+        self._sock = None
+
+    def _requeue(self, batch: list[bytes]) -> None:
+        with self._cond:
+            self._spool.extendleft(reversed(batch))
+            while len(self._spool) > self.spool_size:
+                self._spool.popleft()
+                self.dropped += 1
+            self._inflight = 0
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: not self._spool and not self._inflight, self.flush_timeout)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._wake.set()
+        self._sender.join(self.timeout + self.flush_timeout)
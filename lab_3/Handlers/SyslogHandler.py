@@ -6,8 +6,5 @@ class SyslogHandler(ILogHandler):
         self.log_file = log_file
 
     def handle(self, log_level: LogLevel, text: str) -> None:
-        try:
-            with open(self.log_file, "a") as file:
-                file.write(text + '\n')
-        except:
-            return
\ No newline at end of file
+        with open(self.log_file, "a") as file:
+            file.write(text + '\n')
@@ -0,0 +1,45 @@
+from typing import Any
+
+class LatencyHistogram:
+    BUCKETS = 48
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self._buckets = [0] * self.BUCKETS
+
+    def record(self, elapsed_ns: int) -> None:
+        if not self.count or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self._buckets[min(elapsed_ns.bit_length(), self.BUCKETS - 1)] += 1
+
+    def percentile(self, fraction: float) -> int:
+        if not self.count:
+            return 0
+
+        threshold = fraction * self.count
+        seen = 0
+        for index, amount in enumerate(self._buckets):
+            seen += amount
+            if seen >= threshold:
+                return min((1 << index) - 1, self.max_ns)
+        return self.max_ns
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'total_ns': self.total_ns,
+            'mean_ns': self.total_ns / self.count if self.count else 0.0,
+            'min_ns': self.min_ns,
+            'max_ns': self.max_ns,
+            'p50_ns': self.percentile(0.5),
+            'p90_ns': self.percentile(0.9),
+            'p99_ns': self.percentile(0.99),
+            'buckets': {f'<{1 << index}': amount for index, amount in enumerate(self._buckets) if amount},
+        }
@@ -0,0 +1,50 @@
+from Handlers.ILogHandler import ILogHandler
+from Handlers.QueueClientHandler import QueueClientHandler
+from LogLevel import LogLevel
+from typing import Callable
+import multiprocessing
+
+class LogAggregator:
+    def __init__(self, handler_factory: Callable[[], list[ILogHandler]], queue_size: int = 0,
+                 context: str | None = None) -> None:
+        self._context = multiprocessing.get_context(context)
+        self.queue = self._context.Queue(queue_size)
+        self.handler_factory = handler_factory
+        self._process = None
+
+    def start(self) -> None:
+        self._process = self._context.Process(target=LogAggregator._serve, args=(self.queue, self.handler_factory),
+                                              name='log-aggregator')
+        self._process.start()
+
+    def client(self, batch_size: int = 100, interval: float = 0.5) -> QueueClientHandler:
+        return QueueClientHandler(self.queue, batch_size, interval)
+
+    def stop(self, timeout: float | None = None) -> None:
+        if self._process is None:
+            return
+
+        self.queue.put(None)
+        self._process.join(timeout)
+        self._process = None
+
+    @staticmethod
+    def _serve(queue, handler_factory: Callable[[], list[ILogHandler]]) -> None:
+        handlers = handler_factory()
+        try:
+            while True:
+                batch = queue.get()
+                if batch is None:
+                    break
+
+                for level_value, text, fields in batch:
+                    log_level = LogLevel(level_value)
+                    for handler in handlers:
+                        try:
+                            handler.handle_record(log_level, text, fields)
+                        except Exception:
+                            pass
+        finally:
+            for handler in handlers:
+                handler.flush()
+                handler.close()
@@ -1,30 +1,271 @@
 from Filters.ILogFilter import ILogFilter
 from Formatters.ILogFormatter import ILogFormatter
 from Handlers.ILogHandler import ILogHandler
+from HandlerFanOut import HandlerFanOut
+from LoggerInstrumentation import LoggerInstrumentation
 from LogLevel import LogLevel
+from typing import Any, Callable
+import time
 
 class Logger:
-    def __init__(self, filters: list[ILogFilter], formaters: list[ILogFormatter], handlers: list[ILogHandler]) -> None:
+    def __init__(self, filters: list[ILogFilter], formaters: list[ILogFormatter], handlers: list[ILogHandler],
+                 adaptive: bool = False, reorder_every: int = 1024, fanout: HandlerFanOut | None = None,
+                 instrument: bool = False) -> None:
+        self.adaptive = adaptive
+        self.fanout = fanout
+        self.instrumentation = LoggerInstrumentation() if instrument else None
+        self.reorder_every = reorder_every
+        self._filter_stats = {}
+        self._handler_stats = {}
+        self._handler_errors = {}
+        self._since_reorder = 0
+        self._handler_levels = {}
+        self._filters = []
+        self._handlers = []
+
         self.filters = filters
         self.formaters = formaters
         self.handlers = handlers
+
+    @property
+    def filters(self) -> list[ILogFilter]:
+        return self._filters
+
+    @filters.setter
+    def filters(self, filters: list[ILogFilter]) -> None:
+        self._filters = filters
+        self._refresh_routes()
+
+    def add_filter(self, filtrator: ILogFilter) -> None:
+        self._filters.append(filtrator)
+        self._refresh_routes()
+
+    def remove_filter(self, filtrator: ILogFilter) -> None:
+        self._filters.remove(filtrator)
+        self._filter_stats.pop(id(filtrator), None)
+        self._refresh_routes()
+
+    @property
+    def handlers(self) -> list[ILogHandler]:
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, handlers: list[ILogHandler]) -> None:
+        self._handlers = handlers
+        self._handler_levels = {}
+        self._refresh_routes()
+
+    def add_handler(self, handler: ILogHandler, levels: set[LogLevel] | None = None) -> None:
+        self._handlers.append(handler)
+        if levels is not None:
+            self._handler_levels[id(handler)] = frozenset(levels)
+        self._refresh_routes()
+
+    def remove_handler(self, handler: ILogHandler) -> None:
+        self._handlers.remove(handler)
+        self._handler_levels.pop(id(handler), None)
+        self._handler_stats.pop(id(handler), None)
+        self._handler_errors.pop(id(handler), None)
+        self._refresh_routes()
+
+    def _refresh_routes(self) -> None:
+        enabled = set(LogLevel)
+        for filtrator in self._filters:
+            levels = filtrator.levels()
+            if levels is not None:
+                enabled &= levels
+
+        routes = {}
+        for level in LogLevel:
+            if level not in enabled:
+                routes[level] = ()
+                continue
+            routes[level] = tuple(handler for handler in self._handlers
+                                  if level in self._handler_levels.get(id(handler), enabled))
+        self._routes = routes
+
+    def is_enabled(self, log_level: LogLevel) -> bool:
+        return bool(self._routes[log_level])
     
-    def log(self, log_level: LogLevel, text: str) -> None:
-        for filtrator in self.filters:
-            if not filtrator.match(log_level, text):
-                return
-        
+    def log(self, log_level: LogLevel, text: str | Callable[[], str], *args: Any,
+            fields: dict[str, Any] | None = None) -> None:
+        handlers = self._routes[log_level]
+        if not handlers:
+            return
+
+        text = self._prepare(log_level, text, args)
+        if text is None:
+            return
+
+        self._deliver(handlers, log_level, text, fields)
+
+    def _deliver(self, handlers: tuple[ILogHandler, ...], log_level: LogLevel, text: str,
+                 fields: dict[str, Any] | None) -> None:
+        instrumentation = self.instrumentation
+        if self.fanout is not None:
+            start = time.perf_counter_ns()
+            self.fanout.dispatch(handlers, log_level, text, self._handler_failed, fields)
+            if instrumentation is not None:
+                instrumentation.record(self.fanout, time.perf_counter_ns() - start)
+        elif instrumentation is None:
+            for handler in handlers:
+                self._handle(handler, log_level, text, fields)
+        else:
+            for handler in handlers:
+                start = time.perf_counter_ns()
+                self._handle(handler, log_level, text, fields)
+                instrumentation.record(handler, time.perf_counter_ns() - start)
+
+        for handler in handlers:
+            self._handler_stats[id(handler)] = self._handler_stats.get(id(handler), 0) + 1
+
+    def _handle(self, handler: ILogHandler, log_level: LogLevel, text: str, fields: dict[str, Any] | None) -> None:
+        try:
+            if fields is None:
+                handler.handle(log_level, text)
+            else:
+                handler.handle_record(log_level, text, fields)
+        except Exception as e:
+            self._handler_failed(handler, e)
+
+    def _handler_failed(self, handler: ILogHandler, error: Exception) -> None:
+        self._handler_errors[id(handler)] = self._handler_errors.get(id(handler), 0) + 1
+        if self.instrumentation is not None:
+            self.instrumentation.count_error(handler)
+
+    def _prepare(self, log_level: LogLevel, text: str | Callable[[], str], args: tuple) -> str | None:
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            instrumentation.count_record()
+
+        if args:
+            text = text.format(*args)
+        elif callable(text):
+            text = text()
+
+        if self.adaptive or instrumentation is not None:
+            if not self._match_timed(log_level, text, instrumentation):
+                return None
+        else:
+            for filtrator in self._filters:
+                if not filtrator.match(log_level, text):
+                    return None
+
+        if instrumentation is None:
+            for formater in self.formaters:
+                text = formater.format(log_level, text)
+            return text
+
         for formater in self.formaters:
+            start = time.perf_counter_ns()
             text = formater.format(log_level, text)
-        
-        for handler in self.handlers:
-            handler.handle(log_level, text)
+            instrumentation.record(formater, time.perf_counter_ns() - start)
+        instrumentation.count_passed()
+        return text
+
+    def _match_timed(self, log_level: LogLevel, text: str, instrumentation: LoggerInstrumentation | None) -> bool:
+        passed = True
+        for filtrator in self._filters:
+            start = time.perf_counter_ns()
+            matched = filtrator.match(log_level, text)
+            elapsed = time.perf_counter_ns() - start
+
+            if self.adaptive:
+                stats = self._filter_stats.get(id(filtrator))
+                if stats is None:
+                    stats = self._filter_stats[id(filtrator)] = [0, 0, 0]
+                stats[0] += 1
+                stats[2] += elapsed
+                if not matched:
+                    stats[1] += 1
+            if instrumentation is not None:
+                instrumentation.record(filtrator, elapsed)
+                if not matched:
+                    instrumentation.count_dropped(filtrator)
+
+            if not matched:
+                passed = False
+                break
+
+        if self.adaptive:
+            self._since_reorder += 1
+            if self._since_reorder >= self.reorder_every:
+                self._since_reorder = 0
+                self._reorder_filters()
+        return passed
+
+    def _filter_cost(self, filtrator: ILogFilter) -> float:
+        calls, rejected, total_ns = self._filter_stats.get(id(filtrator), (0, 0, 0))
+        if not calls:
+            return 0.0
+        return (total_ns / calls) / max(rejected / calls, 1e-6)
+
+    def _reorder_filters(self) -> None:
+        ordered = []
+        segment = []
+        for filtrator in self._filters:
+            if filtrator.stateful:
+                ordered.extend(sorted(segment, key=self._filter_cost))
+                ordered.append(filtrator)
+                segment = []
+            else:
+                segment.append(filtrator)
+        ordered.extend(sorted(segment, key=self._filter_cost))
+        self._filters = ordered
+
+    def enable_instrumentation(self) -> None:
+        if self.instrumentation is None:
+            self.instrumentation = LoggerInstrumentation()
+
+    def disable_instrumentation(self) -> None:
+        self.instrumentation = None
+
+    def instrumentation_snapshot(self) -> dict[str, Any]:
+        if self.instrumentation is None:
+            return {}
+        return self.instrumentation.snapshot(self)
+
+    def filter_stats(self) -> list[dict[str, Any]]:
+        if not self.adaptive:
+            return [{'filter': type(filtrator).__name__} for filtrator in self._filters]
+
+        result = []
+        for filtrator in self._filters:
+            calls, rejected, total_ns = self._filter_stats.get(id(filtrator), (0, 0, 0))
+            result.append({
+                'filter': type(filtrator).__name__,
+                'calls': calls,
+                'rejected': rejected,
+                'rejection_rate': rejected / calls if calls else 0.0,
+                'avg_ns': total_ns / calls if calls else 0.0,
+            })
+        return result
+
+    def handler_stats(self) -> list[dict[str, Any]]:
+        return [{
+            'handler': type(handler).__name__,
+            'levels': sorted(level.name for level in LogLevel if handler in self._routes[level]),
+            'records': self._handler_stats.get(id(handler), 0),
+            'errors': self._handler_errors.get(id(handler), 0),
+        } for handler in self._handlers]
     
-    def log_info(self, text: str) -> None:
-        self.log(LogLevel.INFO, text)
+    def log_info(self, text: str | Callable[[], str], *args: Any, fields: dict[str, Any] | None = None) -> None:
+        self.log(LogLevel.INFO, text, *args, fields=fields)
     
-    def log_warn(self, text: str) -> None:
-        self.log(LogLevel.WARN, text)
+    def log_warn(self, text: str | Callable[[], str], *args: Any, fields: dict[str, Any] | None = None) -> None:
+        self.log(LogLevel.WARN, text, *args, fields=fields)
     
-    def log_error(self, text: str) -> None:
-        self.log(LogLevel.ERROR, text)
\ No newline at end of file
+    def log_error(self, text: str | Callable[[], str], *args: Any, fields: dict[str, Any] | None = None) -> None:
+        self.log(LogLevel.ERROR, text, *args, fields=fields)
+
+    def flush(self) -> None:
+        for filtrator in self.filters:
+            filtrator.flush()
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        for filtrator in self.filters:
+            filtrator.close()
+        for handler in self.handlers:
+            handler.close()
@@ -0,0 +1,59 @@
+from LatencyHistogram import LatencyHistogram
+from typing import Any
+import threading
+
+class LoggerInstrumentation:
+    def __init__(self) -> None:
+        self.records = 0
+        self.passed = 0
+        self._histograms = {}
+        self._dropped = {}
+        self._errors = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: object, elapsed_ns: int) -> None:
+        with self._lock:
+            histogram = self._histograms.get(id(stage))
+            if histogram is None:
+                histogram = self._histograms[id(stage)] = LatencyHistogram()
+            histogram.record(elapsed_ns)
+
+    def _count(self, counters: dict, stage: object) -> None:
+        with self._lock:
+            counters[id(stage)] = counters.get(id(stage), 0) + 1
+
+    def count_record(self) -> None:
+        with self._lock:
+            self.records += 1
+
+    def count_passed(self) -> None:
+        with self._lock:
+            self.passed += 1
+
+    def count_dropped(self, filtrator: object) -> None:
+        self._count(self._dropped, filtrator)
+
+    def count_error(self, handler: object) -> None:
+        self._count(self._errors, handler)
+
+    def _stage(self, stage: object, **counters: int) -> dict[str, Any]:
+        histogram = self._histograms.get(id(stage))
+        result = {'name': type(stage).__name__, 'calls': histogram.count if histogram else 0}
+        result.update(counters)
+        result['latency'] = (histogram or LatencyHistogram()).snapshot()
+        return result
+
+    def snapshot(self, logger) -> dict[str, Any]:
+        with self._lock:
+            result = {
+                'records': self.records,
+                'passed': self.passed,
+                'filters': [self._stage(filtrator, dropped=self._dropped.get(id(filtrator), 0))
+                            for filtrator in logger.filters],
+                'formatters': [self._stage(formater) for formater in logger.formaters],
+                'handlers': [self._stage(handler, errors=self._errors.get(id(handler), 0))
+                             for handler in logger.handlers],
+            }
+            if logger.fanout is not None:
+                result['fanout'] = self._stage(logger.fanout)
+            return result
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class OverflowPolicy(Enum):
+    BLOCK = 1
+    DROP_NEWEST = 2
+    DROP_OLDEST = 3
@@ -0,0 +1,94 @@
+import queue
+import threading
+from Filters.ILogFilter import ILogFilter
+from Formatters.ILogFormatter import ILogFormatter
+from Handlers.ILogHandler import ILogHandler
+from LogLevel import LogLevel
+from Logger import Logger
+from OverflowPolicy import OverflowPolicy
+from typing import Any, Callable
+
+class QueueLogger(Logger):
+    def __init__(self, filters: list[ILogFilter], formaters: list[ILogFormatter], handlers: list[ILogHandler],
+                 max_size: int = 1024, workers: int = 1, overflow: OverflowPolicy = OverflowPolicy.BLOCK) -> None:
+        super().__init__(filters, formaters, handlers)
+        self.overflow = overflow
+        self.dropped = 0
+        self.failed = 0
+        self._queue = queue.Queue(max_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def log(self, log_level: LogLevel, text: str | Callable[[], str], *args: Any,
+            fields: dict[str, Any] | None = None) -> None:
+        if self._closed or not self._routes[log_level]:
+            return
+
+        record = (log_level, text, args, fields)
+        if self.overflow is OverflowPolicy.BLOCK:
+            self._queue.put(record)
+            return
+
+        try:
+            self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        with self._lock:
+            if self.overflow is OverflowPolicy.DROP_NEWEST or self._closed:
+                self.dropped += 1
+                return
+
+            while True:
+                try:
+                    self._queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    pass
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _handler_failed(self, handler: ILogHandler, error: Exception) -> None:
+        super()._handler_failed(handler, error)
+        with self._lock:
+            self.failed += 1
+
+    def _work(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                Logger.log(self, record[0], record[1], *record[2], fields=record[3])
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+            finally:
+                self._queue.task_done()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        self._queue.join()
+        super().flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        super().close()
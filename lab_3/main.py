@@ -22,4 +22,8 @@ logger3 = Logger( [], [SimpleFormatter()], [ConsoleHandler(), FtpHandler("localh
 logger1.log(LogLevel.INFO, "It's test")
 logger2.log_warn("#456 Session soon")
 logger2.log_error("#123 Not found")
-logger3.log_info("Hello world!")
\ No newline at end of file
+logger3.log_info("Hello world!")
+
+logger1.close()
+logger2.close()
+logger3.close()
\ No newline at end of file